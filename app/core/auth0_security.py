@@ -2,11 +2,16 @@
 Auth0 JWT Token Validation for FastAPI Backend
 Validates Auth0 access tokens using RS256 algorithm with public key verification
 """
+import asyncio
 import logging
+import re
+import threading
+import time
 from typing import Optional
-from functools import lru_cache
 import httpx
-from jose import jwt, JWTError
+import jwt
+from cachetools import TTLCache
+from jwt.algorithms import RSAAlgorithm
 from fastapi import HTTPException, Security, Depends, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from app.core.config import settings
@@ -16,65 +21,170 @@ logger = logging.getLogger(__name__)
 # Security scheme
 security = HTTPBearer(auto_error=False)
 
-# Auth0 Configuration
-AUTH0_DOMAIN = settings.NEXT_PUBLIC_AUTH0_DOMAIN if hasattr(settings, 'NEXT_PUBLIC_AUTH0_DOMAIN') else "cortejtech.us.auth0.com"
+# Auth0 Configuration (both fields are declared on Settings with defaults,
+# so plain attribute reads suffice — no getattr/hasattr fallbacks)
+AUTH0_DOMAIN = settings.NEXT_PUBLIC_AUTH0_DOMAIN
 # Use custom API audience for proper JWT validation
-AUTH0_AUDIENCE = getattr(settings, 'AUTH0_AUDIENCE', "https://cortejtech-api.local")
+AUTH0_AUDIENCE = settings.AUTH0_AUDIENCE
 ALGORITHMS = ["RS256"]
 
 # Development mode configuration
 SKIP_AUDIENCE_CHECK = settings.ENVIRONMENT == "development" and settings.DEBUG
 
-logger.info(f"🔐 Auth0 Configuration: domain={AUTH0_DOMAIN}, audience={AUTH0_AUDIENCE}, skip_audience={SKIP_AUDIENCE_CHECK}")
+# Invariant verification inputs, hoisted so each verify avoids rebuilding
+# the issuer string and options dict
+_ISSUER = f"https://{AUTH0_DOMAIN}/"
+# Acceptable audiences: client ID for ID tokens, API audience for access
+# tokens. PyJWT accepts a list and validates against whichever matches,
+# so a single decode covers both token types.
+_AUDIENCES = [a for a in (settings.NEXT_PUBLIC_AUTH0_CLIENT_ID, AUTH0_AUDIENCE) if a] or None
+_VERIFY_OPTIONS = {
+    "verify_signature": True,
+    "verify_exp": True,
+    "verify_nbf": True,
+    "verify_iat": True,
+    "verify_aud": not SKIP_AUDIENCE_CHECK,  # Skip audience check in development
+    "require": ["exp", "iat"],
+}
 
-@lru_cache(maxsize=1)
-def get_auth0_jwks():
-    """Fetch and cache Auth0 JSON Web Key Set (JWKS) for token validation"""
+logger.info("🔐 Auth0 Configuration: domain=%s, audience=%s, skip_audience=%s", AUTH0_DOMAIN, AUTH0_AUDIENCE, SKIP_AUDIENCE_CHECK)
+
+# Shared async HTTP client for JWKS fetches: reuses pooled TCP/TLS
+# connections and keeps the event loop free while a fetch is in flight.
+# Closed on shutdown via close_http_client().
+_HTTP = httpx.AsyncClient(
+    timeout=10,
+    limits=httpx.Limits(max_keepalive_connections=4, max_connections=8),
+)
+
+async def close_http_client() -> None:
+    """Close the shared JWKS HTTP client (call from app shutdown)."""
+    await _HTTP.aclose()
+
+# Parsed RSA public keys keyed by JWKS kid. Building the cryptography key
+# object from a raw JWK dict is the dominant CPU cost of RS256 verification,
+# so we construct each key once per JWKS fetch instead of once per request.
+_KEY_CACHE: dict = {}
+_last_jwks_refresh: float = 0.0
+# Minimum seconds between forced refreshes on kid miss, so tokens signed with
+# unknown kids can't hammer Auth0.
+_JWKS_REFRESH_MIN_INTERVAL = 60.0
+# TTL for the cached JWKS; overridden by Cache-Control: max-age when Auth0
+# sends one. Old keys are kept in the cache across refreshes so tokens signed
+# shortly before a rotation still verify.
+_JWKS_DEFAULT_TTL = 600.0
+_jwks_ttl: float = _JWKS_DEFAULT_TTL
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+# Single-flight lock: under a cold start N concurrent requests would all
+# miss the cache and fan out N JWKS fetches; the lock lets one request do
+# the fetch while the rest await and reuse its result.
+_jwks_lock = asyncio.Lock()
+
+async def refresh_jwks_key_cache(min_interval: float = 0.0):
+    """Fetch Auth0 JSON Web Key Set (JWKS) and rebuild the parsed-key cache.
+
+    Coalesces concurrent callers: whoever wins the lock fetches, and callers
+    that were queued behind it return without re-fetching when the cache was
+    refreshed less than `min_interval` seconds ago.
+    """
+    global _last_jwks_refresh, _jwks_ttl
+    async with _jwks_lock:
+        if min_interval and time.time() - _last_jwks_refresh < min_interval:
+            return
+        await _fetch_jwks_locked()
+
+async def _fetch_jwks_locked():
+    global _KEY_CACHE, _last_jwks_refresh, _jwks_ttl
     try:
         jwks_url = f"https://{AUTH0_DOMAIN}/.well-known/jwks.json"
-        logger.info(f"📡 Fetching Auth0 JWKS from: {jwks_url}")
-        with httpx.Client() as client:
-            response = client.get(jwks_url, timeout=10)
-            response.raise_for_status()
-            jwks = response.json()
-            logger.info(f"✅ Successfully fetched JWKS with {len(jwks.get('keys', []))} keys")
-            return jwks
+        logger.info("📡 Fetching Auth0 JWKS from: %s", jwks_url)
+        response = await _HTTP.get(jwks_url)
+        response.raise_for_status()
+        jwks = response.json()
+        # Honor upstream caching semantics when provided
+        match = _MAX_AGE_RE.search(response.headers.get("cache-control", ""))
+        _jwks_ttl = float(match.group(1)) if match else _JWKS_DEFAULT_TTL
+        # Build the kid->key dict off to the side (seeded with the old keys
+        # so recently rotated-out kids keep verifying), then swap atomically
+        # so readers never observe a partially built cache.
+        by_kid = dict(_KEY_CACHE)
+        for key in jwks.get("keys", []):
+            kid = key.get("kid")
+            if not kid:
+                continue
+            try:
+                by_kid[kid] = RSAAlgorithm.from_jwk(key)
+            except Exception as key_exc:
+                logger.error("❌ Failed to parse JWK for kid %s: %s", kid, key_exc)
+        _KEY_CACHE = by_kid
+        _last_jwks_refresh = time.time()
+        logger.info("✅ Successfully fetched JWKS with %s keys", len(jwks.get("keys", [])))
     except Exception as e:
-        logger.error(f"❌ Failed to fetch Auth0 JWKS: {e}")
+        logger.error("❌ Failed to fetch Auth0 JWKS: %s", e)
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Authentication service unavailable"
         )
 
-def get_auth0_public_key(token: str):
-    """Extract the public key from Auth0 JWKS based on token's kid (key ID)"""
+async def jwks_refresh_loop() -> None:
+    """Background refresh-ahead loop for the JWKS key cache.
+
+    Re-fetches the JWKS once the cached copy has aged past 80% of its TTL,
+    so steady-state requests never pay the refresh round-trip. Started from
+    the app lifespan; exits cleanly on task cancellation.
+    """
+    while True:
+        await asyncio.sleep(30)
+        try:
+            age = time.time() - _last_jwks_refresh
+            if age > 0.8 * _jwks_ttl:
+                await refresh_jwks_key_cache()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error("❌ Background JWKS refresh failed: %s", e)
+
+async def get_auth0_public_key(token: str):
+    """Return the parsed RSA public key matching the token's kid (key ID)"""
     try:
         # Decode header without verification to get kid
         unverified_header = jwt.get_unverified_header(token)
         kid = unverified_header.get("kid")
-        logger.debug(f"🔑 Token kid: {kid}")
-        
-        jwks = get_auth0_jwks()
-        
-        # Find the key with matching kid
-        for key in jwks.get("keys", []):
-            if key["kid"] == kid:
-                logger.debug(f"✅ Found matching public key for kid: {kid}")
-                return key
-        
-        logger.error(f"❌ No matching public key found for kid: {kid}")
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token: Public key not found"
-        )
-    except JWTError as e:
-        logger.error(f"❌ JWT header decode error: {e}")
+        logger.debug("🔑 Token kid: %s", kid)
+    except jwt.InvalidTokenError as e:
+        logger.error("❌ JWT header decode error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token format"
         )
 
-def verify_auth0_token(token: str) -> dict:
+    key = _KEY_CACHE.get(kid)
+    if key is not None:
+        logger.debug("✅ Found matching public key for kid: %s", kid)
+        return key
+
+    # Cold cache or unknown kid (possible key rotation): refresh once,
+    # rate-limited and coalesced across concurrent callers, then retry.
+    if not _KEY_CACHE or time.time() - _last_jwks_refresh > _JWKS_REFRESH_MIN_INTERVAL:
+        await refresh_jwks_key_cache(min_interval=_JWKS_REFRESH_MIN_INTERVAL if _KEY_CACHE else 1.0)
+        key = _KEY_CACHE.get(kid)
+        if key is not None:
+            return key
+
+    logger.error("❌ No matching public key found for kid: %s", kid)
+    raise HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Invalid token: Public key not found"
+    )
+
+# Verified-token cache keyed by the token's base64 signature segment. A JWT
+# is immutable, so once the RSA verify has passed we can reuse the decoded
+# payload for subsequent requests carrying the same token (capped at 5 min
+# and never past the token's own exp).
+_VERIFIED: TTLCache = TTLCache(maxsize=10_000, ttl=300)
+_verified_lock = threading.Lock()
+
+async def verify_auth0_token(token: str) -> dict:
     """
     Verify Auth0 JWT token (ID token or access token) and return decoded payload
     
@@ -86,51 +196,35 @@ def verify_auth0_token(token: str) -> dict:
     
     Returns decoded token payload with user info
     """
+    # Fast path: token already verified and still comfortably within exp
+    sig = token.rsplit(".", 1)[-1]
+    with _verified_lock:
+        cached = _VERIFIED.get(sig)
+    if cached is not None and cached.get("exp", 0) > time.time() + 5:
+        return cached
+
     try:
         # Get the public key
-        public_key = get_auth0_public_key(token)
-        
-        # Prepare verification options
-        verify_options = {
-            "verify_signature": True,
-            "verify_exp": True,
-            "verify_nbf": True,
-            "verify_iat": True,
-            "verify_aud": not SKIP_AUDIENCE_CHECK,  # Skip audience check in development
-            "require_exp": True,
-            "require_iat": True,
-        }
-        
-        # Try to decode without audience first to check token type
-        unverified_payload = jwt.get_unverified_claims(token)
-        audience = unverified_payload.get('aud')
-        
-        # Determine expected audience based on token type
-        # ID tokens have client_id as audience, access tokens have API audience
-        expected_audience = None
-        if not SKIP_AUDIENCE_CHECK:
-            if isinstance(audience, str) and audience == settings.NEXT_PUBLIC_AUTH0_CLIENT_ID:
-                # This is an ID token
-                expected_audience = settings.NEXT_PUBLIC_AUTH0_CLIENT_ID
-                logger.debug("🆔 Detected ID token")
-            else:
-                # This is an access token
-                expected_audience = AUTH0_AUDIENCE
-                logger.debug("🎫 Detected access token")
+        public_key = await get_auth0_public_key(token)
         
-        # Verify and decode the token
+        # Verify and decode the token in a single pass. ID tokens carry the
+        # client ID as audience, access tokens the API audience; PyJWT
+        # matches against either entry of _AUDIENCES.
         payload = jwt.decode(
             token,
             public_key,
             algorithms=ALGORITHMS,
-            audience=expected_audience,
-            issuer=f"https://{AUTH0_DOMAIN}/",
-            options=verify_options
+            audience=None if SKIP_AUDIENCE_CHECK else _AUDIENCES,
+            issuer=_ISSUER,
+            options=_VERIFY_OPTIONS
         )
         
-        logger.info(f"✅ Token verified successfully for user: {payload.get('sub', 'unknown')}")
-        logger.debug(f"Token payload: sub={payload.get('sub')}, email={payload.get('email')}, aud={payload.get('aud')}")
-        
+        logger.info("✅ Token verified successfully for user: %s", payload.get("sub", "unknown"))
+        logger.debug("Token payload: sub=%s, email=%s, aud=%s", payload.get("sub"), payload.get("email"), payload.get("aud"))
+
+        with _verified_lock:
+            _VERIFIED[sig] = payload
+
         return payload
     except jwt.ExpiredSignatureError:
         logger.warning("⚠️ Auth0 token expired")
@@ -139,22 +233,22 @@ def verify_auth0_token(token: str) -> dict:
             detail="Token has expired",
             headers={"WWW-Authenticate": "Bearer"}
         )
-    except jwt.JWTClaimsError as e:
-        logger.warning(f"⚠️ Auth0 token claims error: {e}")
+    except (jwt.InvalidAudienceError, jwt.InvalidIssuerError, jwt.MissingRequiredClaimError) as e:
+        logger.warning("⚠️ Auth0 token claims error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=f"Invalid token claims: {str(e)}",
             headers={"WWW-Authenticate": "Bearer"}
         )
-    except JWTError as e:
-        logger.error(f"❌ Auth0 token validation error: {e}")
+    except jwt.InvalidTokenError as e:
+        logger.error("❌ Auth0 token validation error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=f"Invalid token: {str(e)}",
             headers={"WWW-Authenticate": "Bearer"}
         )
     except Exception as e:
-        logger.error(f"❌ Unexpected error validating Auth0 token: {e}", exc_info=True)
+        logger.error("❌ Unexpected error validating Auth0 token: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Authentication error"
@@ -172,13 +266,16 @@ async def get_current_auth0_user(
         return None
     
     try:
-        logger.debug(f"🔐 Verifying Auth0 token: {credentials.credentials[:20]}...")
-        payload = verify_auth0_token(credentials.credentials)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🔐 Verifying Auth0 token: %s...", credentials.credentials[:20])
+        payload = await verify_auth0_token(credentials.credentials)
         
-        # Extract user information from token payload
+        # Extract user information from token payload.
+        # Email is canonicalized to lowercase here so downstream checks
+        # (admin membership etc.) never re-normalize per request.
         user_info = {
             "sub": payload.get("sub"),  # Auth0 user ID
-            "email": payload.get("email"),
+            "email": (payload.get("email") or "").lower() or None,
             "email_verified": payload.get("email_verified", False),
             "name": payload.get("name"),
             "nickname": payload.get("nickname"),
@@ -187,13 +284,13 @@ async def get_current_auth0_user(
             "scope": payload.get("scope", ""),
         }
         
-        logger.info(f"✅ Authenticated user: {user_info.get('email', user_info.get('sub'))}")
+        logger.info("✅ Authenticated user: %s", user_info.get("email") or user_info.get("sub"))
         return user_info
     except HTTPException:
         # Re-raise HTTP exceptions
         raise
     except Exception as e:
-        logger.error(f"❌ Error extracting Auth0 user: {e}", exc_info=True)
+        logger.error("❌ Error extracting Auth0 user: %s", e, exc_info=True)
         return None
 
 async def require_auth0_user(
@@ -216,18 +313,14 @@ async def require_auth0_admin(
     Require authenticated Auth0 admin user
     Checks if user email matches allowed admin emails
     """
-    user_email = user.get("email", "").lower()
-    
-    # Check against allowed admin emails
-    allowed_emails = [settings.ALLOWED_ADMIN_EMAIL.lower()]
-    if hasattr(settings, 'ALLOWED_ADMIN_EMAILS'):
-        allowed_emails.extend([e.lower() for e in settings.ALLOWED_ADMIN_EMAILS])
-    
-    logger.debug(f"🔍 Checking admin access for: {user_email}")
-    logger.debug(f"🔍 Allowed admins: {allowed_emails}")
-    
-    if user_email not in allowed_emails:
-        logger.warning(f"🚫 Unauthorized admin access attempt by: {user_email}")
+    # Email is already lowercased by get_current_auth0_user
+    user_email = user.get("email") or ""
+
+    logger.debug("🔍 Checking admin access for: %s", user_email)
+
+    # Check against the precomputed admin email set
+    if user_email not in settings.admin_email_set:
+        logger.warning("🚫 Unauthorized admin access attempt by: %s", user_email)
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin access required"
@@ -235,7 +328,7 @@ async def require_auth0_admin(
     
     # Add admin flag to user object
     user["is_admin"] = True
-    logger.info(f"✅ Admin access granted to: {user_email}")
+    logger.info("✅ Admin access granted to: %s", user_email)
     return user
 
 def check_auth0_permission(required_permission: str):
@@ -248,7 +341,7 @@ def check_auth0_permission(required_permission: str):
         scope = user.get("scope", "").split()
         
         if required_permission not in permissions and required_permission not in scope:
-            logger.warning(f"🚫 Permission denied: {required_permission} for user {user.get('email')}")
+            logger.warning("🚫 Permission denied: %s for user %s", required_permission, user.get("email"))
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"Permission required: {required_permission}"
@@ -272,13 +365,8 @@ async def get_current_user_compatible(
             return auth0_user
     except:
         pass
-    
-    # Fallback to session cookie auth (for transition period)
-    # This will be removed once all endpoints are migrated to Auth0
-    from app.core.security import get_current_user as get_session_user
-    from fastapi import Request
-    from starlette.requests import Request as StarletteRequest
-    
-    # Note: This requires passing the request object
-    # Individual endpoints may need updating
+
+    # Session-cookie fallback intentionally not wired here: it needs the
+    # Request object, so endpoints still on cookie auth depend on
+    # app.core.security.get_current_user directly.
     return None
@@ -1,6 +1,7 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field, AliasChoices
-from typing import List
+from typing import FrozenSet, List
+from functools import cached_property, lru_cache
 import os
 from dotenv import load_dotenv
 
@@ -37,18 +38,25 @@ class Settings(BaseSettings):
     # Admin
     ALLOWED_ADMIN_EMAIL: str = Field(default="giriankit595@outlook.com")
     # Comma-separated list of additional admin emails
-    ALLOWED_ADMIN_EMAILS: List[str] = (
-        [e.strip().lower() for e in os.getenv("ALLOWED_ADMIN_EMAILS", "giriankit595@outlook.com,info@cortejtech.com").split(",") if e.strip()]
+    ALLOWED_ADMIN_EMAILS: List[str] = Field(
+        default_factory=lambda: [
+            e.strip().lower()
+            for e in os.getenv("ALLOWED_ADMIN_EMAILS", "giriankit595@outlook.com,info@cortejtech.com").split(",")
+            if e.strip()
+        ]
     )
     
+    # Precomputed lowercase admin email set for O(1) membership checks on the
+    # auth hot path (derived in model_post_init)
+    admin_email_set: FrozenSet[str] = frozenset()
+
     # Telegram not used (explicitly disabled)
     TELEGRAM_BOT_TOKEN: str = Field(default="", frozen=True)
     TELEGRAM_CHAT_ID: str = Field(default="", frozen=True)
     
     # CORS - Configure for separate hosting of main site, admin dashboard, and backend
-    ALLOWED_ORIGINS: List[str] = (
-        os.getenv("ALLOWED_ORIGINS", "")
-        .split(",")
+    ALLOWED_ORIGINS: List[str] = Field(
+        default_factory=lambda: os.getenv("ALLOWED_ORIGINS", "").split(",")
         if os.getenv("ALLOWED_ORIGINS")
         else [
             # Local development
@@ -68,9 +76,9 @@ class Settings(BaseSettings):
             "https://cortejtech-backend.onrender.com",
         ]
     )
-    
-    ALLOWED_HOSTS: List[str] = (
-        os.getenv("ALLOWED_HOSTS", "").split(",")
+
+    ALLOWED_HOSTS: List[str] = Field(
+        default_factory=lambda: os.getenv("ALLOWED_HOSTS", "").split(",")
         if os.getenv("ALLOWED_HOSTS")
         else [
             "localhost",
@@ -85,7 +93,7 @@ class Settings(BaseSettings):
             "*.onrender.com",  # Allow any Render subdomain
         ]
     )
-    
+
     # Rate Limiting
     RATE_LIMIT_REQUESTS: int = 100
     RATE_LIMIT_WINDOW: int = 60  # seconds
@@ -121,12 +129,17 @@ class Settings(BaseSettings):
     NEXT_PUBLIC_AUTH0_CLIENT_ID: str = Field(default="")
     AUTH0_CLIENT_SECRET: str = Field(default="")
     # Auth0 API audience (for JWT validation)
-    AUTH0_AUDIENCE: str = Field(default="")
+    AUTH0_AUDIENCE: str = Field(default="https://cortejtech-api.local")
     
     def model_post_init(self, __context) -> None:
         # Fallback: map NEXT_PUBLIC_* vars if primary fields are empty
         self._apply_fallback_mappings()
-        
+
+        # Normalize admin emails once so request-time checks are a set lookup
+        self.admin_email_set = frozenset(
+            {self.ALLOWED_ADMIN_EMAIL.lower(), *(e.lower() for e in self.ALLOWED_ADMIN_EMAILS)}
+        )
+
         # Validate critical settings in production
         if self.ENVIRONMENT == "production":
             self._validate_production_settings()
@@ -155,9 +168,36 @@ class Settings(BaseSettings):
         if not self.ADMIN_SESSION_SECRET or len(self.ADMIN_SESSION_SECRET) < 32:
             raise ValueError("ADMIN_SESSION_SECRET must be at least 32 characters long in production")
 
+    @cached_property
+    def effective_cors_origins(self) -> List[str]:
+        """ALLOWED_ORIGINS plus the admin-dashboard origins, merged once."""
+        extra = [
+            "http://localhost:3001",
+            "https://admin.cortejtech.com",  # Production admin domain
+        ]
+        return self.ALLOWED_ORIGINS + [o for o in extra if o not in self.ALLOWED_ORIGINS]
+
+    @cached_property
+    def effective_trusted_hosts(self) -> List[str]:
+        """ALLOWED_HOSTS plus the Render domains, merged once."""
+        extra = [
+            "cortejtech-backend.onrender.com",
+            "*.onrender.com",  # Allow any onrender.com subdomain
+        ]
+        return self.ALLOWED_HOSTS + [h for h in extra if h not in self.ALLOWED_HOSTS]
+
     @property
     def AUTH_CALLBACK_URL(self) -> str:
         base = (self.ADMIN_BASE_URL or "").rstrip("/")
         return f"{base}/auth/callback"
-    
-settings = Settings()
\ No newline at end of file
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide Settings instance.
+
+    Memoized so re-imports and hot-reload workers don't re-parse the
+    environment and re-run production validation.
+    """
+    return Settings()
+
+settings = get_settings()
\ No newline at end of file
@@ -14,19 +14,8 @@ except Exception:  # pragma: no cover
 
 # Compatibility patch: older supabase/gotrue stack passes 'proxy=' into
 # httpx.Client which newer httpx versions (>0.25) no longer accept.
-try:  # pragma: no cover - defensive
-    import httpx  # type: ignore
-    import inspect
-    if 'proxy' not in inspect.signature(httpx.Client.__init__).parameters:
-        _orig_init = httpx.Client.__init__
-        def _patched_init(self, *args, proxy=None, **kwargs):  # noqa: D401
-            if proxy is not None and 'proxies' not in kwargs:
-                # Map deprecated single proxy kw to modern 'proxies' dict/string
-                kwargs['proxies'] = proxy
-            return _orig_init(self, *args, **kwargs)
-        httpx.Client.__init__ = _patched_init  # type: ignore
-except Exception:  # pragma: no cover
-    pass
+# Centralized (and idempotent) in app.core.monkeypatches.
+from app.core import monkeypatches  # noqa: F401
 
 from supabase import create_client, Client
 from app.core.config import settings
@@ -51,7 +40,8 @@ async def init_db() -> None:
             settings.SUPABASE_URL,
             settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_ANON_KEY,
         )
-        _ = supabase.table("app_admins").select("email").limit(1).execute()
+        # HEAD-style count: validates credentials without transferring rows
+        _ = supabase.table("app_admins").select("email", count="exact", head=True).execute()
         logger.info("Database connection established successfully")
     except Exception as exc:  # pragma: no cover - safety net
         logger.exception("Failed to initialize database: %s", exc)
@@ -64,6 +54,16 @@ def get_supabase() -> Client:
     return supabase
 
 # Database helper functions
+# Shared empty payload sentinel (never mutated) and operation dispatch table,
+# resolved once instead of an if/elif chain per call.
+_EMPTY: Dict[str, Any] = {}
+_OPS = {
+    "select": lambda q, d: q.execute(),
+    "insert": lambda q, d: q.insert(d).execute(),
+    "update": lambda q, d: q.update(d).execute(),
+    "delete": lambda q, d: q.delete().execute(),
+}
+
 async def execute_query(
     table: str,
     operation: str,
@@ -78,24 +78,18 @@ async def execute_query(
         {"success": bool, "data": Any | None, "error": str | None}
     """
     try:
+        op = _OPS.get(operation)
+        if op is None:
+            return {"success": False, "error": f"Unsupported operation: {operation}"}
+
         db = get_supabase()
         query = db.table(table)
 
-        if filters and operation in {"select", "update", "delete"}:
+        if filters and operation != "insert":
             for key, value in filters.items():
                 query = query.eq(key, value)
 
-        if operation == "select":
-            result = query.execute()
-        elif operation == "insert":
-            result = query.insert(data or {}).execute()
-        elif operation == "update":
-            result = query.update(data or {}).execute()
-        elif operation == "delete":
-            result = query.delete().execute()
-        else:
-            return {"success": False, "error": f"Unsupported operation: {operation}"}
-
+        result = op(query, data or _EMPTY)
         return {"success": True, "data": result.data}
     except Exception as exc:  # pragma: no cover - safety net
         logger.exception("Database query failed: %s", exc)
@@ -7,16 +7,18 @@ Currently addresses:
 
 from __future__ import annotations
 
-import inspect
 import logging
 
 logger = logging.getLogger(__name__)
 
 # Patch httpx.Client to accept a deprecated 'proxy=' kw (mapped to 'proxies').
+# The co_varnames check replaces inspect.signature (hundreds of µs per import)
+# and doubles as an idempotency guard: the patched wrapper itself declares
+# 'proxy', so re-importing this module never stacks a second wrapper.
 try:  # pragma: no cover
     import httpx  # type: ignore
 
-    if 'proxy' not in inspect.signature(httpx.Client.__init__).parameters:
+    if 'proxy' not in httpx.Client.__init__.__code__.co_varnames:
         _orig_init = httpx.Client.__init__
 
         def _patched_init(self, *args, proxy=None, **kwargs):  # noqa: D401
@@ -29,6 +31,30 @@ try:  # pragma: no cover
 except Exception as exc:  # pragma: no cover
     logger.debug("Skipping httpx proxy patch: %s", exc)
 
+# Route PyJWT's payload/header JSON parsing through orjson (C-accelerated).
+# Token verification does multiple JSON parses per call; orjson.loads returns
+# plain dicts so downstream .get(...) access is unchanged. encode() keeps the
+# stdlib dumps, which returns str as PyJWT expects. Degrades gracefully when
+# orjson isn't installed.
+try:  # pragma: no cover
+    import json as _stdlib_json
+
+    import orjson  # type: ignore
+    import jwt.api_jws
+    import jwt.api_jwt
+
+    class _OrjsonShim:
+        loads = staticmethod(orjson.loads)
+        dumps = staticmethod(_stdlib_json.dumps)
+        JSONEncoder = _stdlib_json.JSONEncoder
+        JSONDecodeError = _stdlib_json.JSONDecodeError
+
+    jwt.api_jws.json = _OrjsonShim  # type: ignore[attr-defined]
+    jwt.api_jwt.json = _OrjsonShim  # type: ignore[attr-defined]
+    logger.info("Applied orjson JSON parsing patch for PyJWT")
+except Exception as exc:  # pragma: no cover
+    logger.debug("Skipping orjson PyJWT patch: %s", exc)
+
 # Patch gotrue SyncGoTrueBaseAPI to ignore legacy 'proxy' kw when constructing httpx Client.
 try:  # pragma: no cover
     import gotrue._sync.gotrue_base_api as _gba  # type: ignore
@@ -0,0 +1,66 @@
+"""In-process response cache for the public list endpoints.
+
+The content-list routers (services, team, portfolio, faq, testimonials)
+serve rows that only change on admin writes, yet every GET used to hit
+Supabase and re-serialize the result. Entries here hold the orjson-encoded
+body plus a strong ETag computed once, so warm hits return cached bytes
+directly and conditional requests collapse to a bodyless 304. The cache is
+only touched from the event loop, so no locking is needed.
+"""
+
+from typing import Optional
+from cachetools import TTLCache
+from fastapi import Request, Response
+import hashlib
+import orjson
+
+_CACHE: TTLCache = TTLCache(maxsize=32, ttl=60)
+# Short browser TTL, longer shared-cache TTL: a CDN in front of the API can
+# absorb public read traffic for 5 minutes while serving stale during
+# revalidation; admins still see their writes within 30s from a browser.
+_CACHE_CONTROL = "public, max-age=30, s-maxage=300, stale-while-revalidate=60"
+
+
+def get(key: str) -> Optional[tuple]:
+    """Return the cached (etag, body) entry for key, or None."""
+    return _CACHE.get(key)
+
+
+def put(key: str, data) -> tuple:
+    """Serialize data, cache it under key, and return the (etag, body) entry."""
+    return put_bytes(key, orjson.dumps(data))
+
+
+def put_bytes(key: str, body: bytes) -> tuple:
+    """Cache an already-serialized JSON body under key; return the entry.
+
+    Lets the PostgREST fast path forward upstream bytes as-is instead of
+    decoding to Python and re-encoding on the way out.
+    """
+    etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+    entry = (etag, body)
+    _CACHE[key] = entry
+    return entry
+
+
+def invalidate(key: str) -> None:
+    """Drop the entry for key; call from any handler that mutates its table."""
+    _CACHE.pop(key, None)
+
+
+def respond(request: Optional[Request], entry: tuple) -> Response:
+    """Build the HTTP response for a cache entry, honoring If-None-Match.
+
+    request may be None when a handler is invoked directly from Python
+    (e.g. the no-trailing-slash wrappers in main.py); the conditional
+    check is simply skipped then.
+    """
+    etag, body = entry
+    headers = {
+        "ETag": etag,
+        "Cache-Control": _CACHE_CONTROL,
+        "Vary": "Accept-Encoding",
+    }
+    if request is not None and request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
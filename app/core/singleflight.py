@@ -0,0 +1,42 @@
+"""Async request coalescing for duplicate in-flight fetches.
+
+When several requests miss the response cache at the same moment, each
+would otherwise issue its own identical Supabase query. run_once lets
+only the first caller per key run the fetch; concurrent callers await
+the same future and share its result (or its exception). State lives on
+the event loop only, so no locking is needed.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, TypeVar
+
+T = TypeVar("T")
+
+_inflight: Dict[str, asyncio.Future] = {}
+
+
+async def run_once(key: str, coro_factory: Callable[[], Awaitable[T]]) -> T:
+    """Run coro_factory() once per key at a time, sharing the outcome.
+
+    If a fetch for key is already in flight, await its result instead of
+    starting another. The leader's exception propagates to every waiter.
+    """
+    fut = _inflight.get(key)
+    if fut is not None:
+        return await fut
+
+    fut = asyncio.get_running_loop().create_future()
+    _inflight[key] = fut
+    try:
+        result = await coro_factory()
+    except BaseException as exc:
+        fut.set_exception(exc)
+        # Mark retrieved in case no waiter joined, to silence the
+        # "exception was never retrieved" warning.
+        fut.exception()
+        raise
+    else:
+        fut.set_result(result)
+        return result
+    finally:
+        _inflight.pop(key, None)
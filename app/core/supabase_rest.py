@@ -0,0 +1,34 @@
+"""Shared keep-alive httpx client for direct PostgREST calls.
+
+supabase-py rebuilds a query URL through its fluent builder on every
+call. The public list queries never change shape, so the hot path can
+skip the builder entirely: prebuild the REST URL once and issue the GET
+over one pooled AsyncClient, reusing connections across requests and
+routers. HTTP/2 is left off because h2 is not a project dependency.
+"""
+
+import httpx
+from app.core.config import settings
+
+_KEY = settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_ANON_KEY
+
+REST_BASE = f"{settings.SUPABASE_URL}/rest/v1"
+HEADERS = {
+    "apikey": _KEY,
+    "Authorization": f"Bearer {_KEY}",
+}
+
+client = httpx.AsyncClient(
+    timeout=10,
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+)
+
+
+def table_url(table: str, query: str) -> str:
+    """Build a REST URL for table with a fixed query string."""
+    return f"{REST_BASE}/{table}?{query}"
+
+
+async def close_supabase_rest() -> None:
+    """Close the shared client; call from the lifespan shutdown."""
+    await client.aclose()
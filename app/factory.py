@@ -0,0 +1,77 @@
+"""Shared FastAPI application scaffolding for the two entrypoints.
+
+main.py (public) and main_admin.py (admin) wire different routers and
+middleware, but their lifespan, default response class, fallback error
+handler, and root/health endpoints were copy-pasted and had started to
+drift. create_app builds that common shell once; each entrypoint adds
+its own middleware and router stack on top.
+"""
+
+from contextlib import asynccontextmanager
+import asyncio
+import logging
+
+import orjson
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import ORJSONResponse
+
+from app.core.auth0_security import close_http_client, jwks_refresh_loop
+from app.core.supabase_rest import close_supabase_rest
+from app.core.database import init_db
+from app.services.email import close_email_client
+
+logger = logging.getLogger(__name__)
+
+# Liveness probes hit /health every few seconds on every pod; the body never
+# changes, so encode it once instead of re-serializing per probe.
+_HEALTH_BODY = orjson.dumps({"status": "healthy", "version": "1.0.0"})
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Startup
+    await init_db()
+    jwks_task = asyncio.create_task(jwks_refresh_loop())
+    yield
+    # Shutdown
+    jwks_task.cancel()
+    await close_http_client()
+    await close_supabase_rest()
+    await close_email_client()
+
+
+def create_app(*, title: str, description: str, root_message: str) -> FastAPI:
+    """Build the shared application shell; callers add middleware and routers."""
+    app = FastAPI(
+        title=title,
+        description=description,
+        version="1.0.0",
+        lifespan=lifespan,
+        # orjson serializes straight to bytes, 2-5x faster than stdlib json on
+        # the list-shaped payloads this API mostly returns
+        default_response_class=ORJSONResponse,
+    )
+
+    @app.exception_handler(Exception)
+    async def global_exception_handler(request: Request, exc: Exception):
+        """Global fallback exception handler.
+
+        Logs the exception with traceback and returns a generic 500 response so
+        implementation details are not leaked to clients.
+        """
+        logger.exception("Unhandled exception processing %s %s", request.method, request.url)
+        return ORJSONResponse(status_code=500, content={"detail": "Internal Server Error"})
+
+    # Fixed payloads, pre-encoded at startup; a fresh Response is built per
+    # request because Starlette mutates response headers in place.
+    root_body = orjson.dumps({"message": root_message, "status": "running"})
+
+    @app.get("/")
+    async def root():
+        return Response(content=root_body, media_type="application/json")
+
+    @app.get("/health")
+    async def health_check():
+        return Response(content=_HEALTH_BODY, media_type="application/json")
+
+    return app
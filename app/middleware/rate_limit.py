@@ -1,42 +1,103 @@
 from fastapi import Request, Response, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
+import os
 import time
 import asyncio
-from collections import defaultdict, deque
-from typing import Dict, Deque
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
 import logging
 
+try:  # pragma: no cover - optional backend
+    import redis.asyncio as aioredis
+except Exception:  # pragma: no cover
+    aioredis = None
+
 logger = logging.getLogger(__name__)
 
+# Paths exempt from rate limiting; frozenset gives a hashed membership test
+# on every request instead of a linear list scan.
+_SKIP_PATHS = frozenset({"/health", "/", "/docs", "/redoc", "/openapi.json", "/favicon.ico"})
+
 class RateLimitMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app, requests_per_minute: int = 100):
+    # Cap on tracked client IPs; least-recently-seen entries are evicted so
+    # silent IPs can't grow the table unbounded.
+    MAX_TRACKED_IPS = 10_000
+
+    def __init__(self, app, requests_per_minute: int = 100, redis_url: Optional[str] = None):
         super().__init__(app)
         self.requests_per_minute = requests_per_minute
-        self.requests: Dict[str, Deque[float]] = defaultdict(deque)
-        
+        # Fixed-window counters per IP: (window_minute, count). One arithmetic
+        # check per request instead of scanning a per-IP timestamp deque.
+        self.buckets: "OrderedDict[str, Tuple[int, int]]" = OrderedDict()
+        # Shared counters via Redis INCR when configured, so limits hold
+        # across uvicorn workers. Opt-in via REDIS_URL; the in-process
+        # buckets remain as the fallback whenever Redis is unreachable.
+        self._redis = None
+        redis_url = redis_url or os.getenv("REDIS_URL")
+        if aioredis is not None and redis_url:
+            try:
+                self._redis = aioredis.from_url(
+                    redis_url,
+                    socket_timeout=0.2,
+                    socket_connect_timeout=0.2,
+                )
+            except Exception as exc:  # pragma: no cover - defensive
+                logger.warning("Rate limiter Redis unavailable, using in-memory counters: %s", exc)
+                self._redis = None
+
+    async def _incr_redis(self, client_ip: str, minute: int) -> int:
+        """Increment the shared per-IP counter for this window (one round-trip)."""
+        key = f"rl:{client_ip}:{minute}"
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.incr(key)
+            pipe.expire(key, 70)
+            count, _ = await pipe.execute()
+        return int(count)
+
+    def _incr_local(self, client_ip: str, minute: int) -> int:
+        window, count = self.buckets.get(client_ip, (minute, 0))
+        if window != minute:
+            window, count = minute, 0
+        count += 1
+        self.buckets[client_ip] = (window, count)
+        self.buckets.move_to_end(client_ip)
+        if len(self.buckets) > self.MAX_TRACKED_IPS:
+            self.buckets.popitem(last=False)
+        return count
+
     async def dispatch(self, request: Request, call_next):
         # Allow CORS preflight without rate limiting
         if request.method == "OPTIONS":
             return await call_next(request)
+        # Skip rate limiting for health checks and docs. URL attribute access
+        # parses lazily, so resolve the path into a local once.
+        path = request.url.path
+        if path in _SKIP_PATHS:
+            return await call_next(request)
+
         # Get client IP
         client_ip = request.client.host
-        
-        # Skip rate limiting for health checks
-        if request.url.path in ["/health", "/", "/docs", "/redoc"]:
-            return await call_next(request)
-            
+
         current_time = time.time()
-        
-        # Clean old requests (older than 1 minute)
-        minute_ago = current_time - 60
-        while self.requests[client_ip] and self.requests[client_ip][0] < minute_ago:
-            self.requests[client_ip].popleft()
-            
+        minute = int(current_time // 60)
+
+        count = 0
+        if self._redis is not None:
+            try:
+                count = await self._incr_redis(client_ip, minute)
+            except Exception as exc:
+                logger.debug("Redis rate-limit increment failed, falling back in-memory: %s", exc)
+                count = 0
+        if not count:
+            count = self._incr_local(client_ip, minute)
+
+        window_reset = str((minute + 1) * 60)
+
         # Check rate limit
-        if len(self.requests[client_ip]) >= self.requests_per_minute:
-            logger.warning(f"Rate limit exceeded for IP: {client_ip}")
-            return JSONResponse(
+        if count > self.requests_per_minute:
+            logger.warning("Rate limit exceeded for IP: %s", client_ip)
+            return ORJSONResponse(
                 status_code=429,
                 content={
                     "error": "Rate limit exceeded",
@@ -46,20 +107,19 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                     "Retry-After": "60",
                     "X-RateLimit-Limit": str(self.requests_per_minute),
                     "X-RateLimit-Remaining": "0",
-                    "X-RateLimit-Reset": str(int(current_time + 60))
+                    "X-RateLimit-Reset": window_reset
                 }
             )
-            
-        # Add current request
-        self.requests[client_ip].append(current_time)
-        
+
         # Process request
         response = await call_next(request)
-        
-        # Add rate limit headers
-        remaining = max(0, self.requests_per_minute - len(self.requests[client_ip]))
-        response.headers["X-RateLimit-Limit"] = str(self.requests_per_minute)
-        response.headers["X-RateLimit-Remaining"] = str(remaining)
-        response.headers["X-RateLimit-Reset"] = str(int(current_time + 60))
-        
-        return response
\ No newline at end of file
+
+        # Add rate limit headers in one batch
+        remaining = self.requests_per_minute - count
+        response.headers.update({
+            "X-RateLimit-Limit": str(self.requests_per_minute),
+            "X-RateLimit-Remaining": str(remaining if remaining > 0 else 0),
+            "X-RateLimit-Reset": window_reset,
+        })
+
+        return response
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr
 from typing import Optional
 from datetime import datetime
 
@@ -6,6 +6,8 @@ class MagicLinkRequest(BaseModel):
     email: EmailStr
 
 class MagicLinkResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     success: bool
     message: str
 
@@ -14,6 +16,8 @@ class AuthCallbackRequest(BaseModel):
     state: Optional[str] = None
 
 class AuthResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     success: bool
     access_token: Optional[str] = None
     token_type: str = "bearer"
@@ -1,8 +1,14 @@
-from pydantic import BaseModel, HttpUrl
+from pydantic import BaseModel, ConfigDict, HttpUrl
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
+# Shared config for row-shaped DTOs validated from Supabase results: ignore
+# unknown columns instead of erroring and skip default re-validation.
+_ROW_CONFIG = ConfigDict(extra="ignore", validate_default=False)
+
 class ContactMessage(BaseModel):
+    model_config = _ROW_CONFIG
+
     id: Optional[str] = None
     name: str
     email: str
@@ -13,10 +19,14 @@ class ContactMessage(BaseModel):
     ip_address: Optional[str] = None
 
 class ContactResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     success: bool
     message: str
 
 class Service(BaseModel):
+    model_config = _ROW_CONFIG
+
     id: Optional[str] = None
     title: str
     description: str
@@ -27,6 +37,8 @@ class Service(BaseModel):
     active: bool = True
 
 class TeamMember(BaseModel):
+    model_config = _ROW_CONFIG
+
     id: Optional[str] = None
     name: str
     position: str
@@ -37,6 +49,8 @@ class TeamMember(BaseModel):
     active: bool = True
 
 class Portfolio(BaseModel):
+    model_config = _ROW_CONFIG
+
     id: Optional[str] = None
     title: str
     description: str
@@ -62,6 +76,8 @@ class Portfolio(BaseModel):
     active: bool = True
 
 class FAQ(BaseModel):
+    model_config = _ROW_CONFIG
+
     id: Optional[str] = None
     question: str
     answer: str
@@ -70,6 +86,8 @@ class FAQ(BaseModel):
     active: bool = True
 
 class Testimonial(BaseModel):
+    model_config = _ROW_CONFIG
+
     id: Optional[str] = None
     name: str
     company: Optional[str] = None
@@ -82,10 +100,17 @@ class Testimonial(BaseModel):
     active: bool = True
 
 class AboutContent(BaseModel):
+    model_config = _ROW_CONFIG
+
     id: Optional[str] = None
     title: str
     content: str
     mission: Optional[str] = None
     vision: Optional[str] = None
     values: List[str] = []
-    updated_at: Optional[datetime] = None
\ No newline at end of file
+    updated_at: Optional[datetime] = None
+
+class BulkDeleteRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+    ids: List[str]
\ No newline at end of file
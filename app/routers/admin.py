@@ -1,8 +1,10 @@
-from fastapi import APIRouter, HTTPException, Depends, Request, status
+from fastapi import APIRouter, HTTPException, Depends, Request, status, BackgroundTasks
 from app.core.security import log_admin_action
 from app.core.database import get_supabase
 from typing import List, Dict, Any
+import asyncio
 import logging
+import time
 
 # Import Auth0 security (ONLY authentication method)
 from app.core.auth0_security import require_auth0_admin
@@ -10,6 +12,51 @@ from app.core.auth0_security import require_auth0_admin
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Dashboard stats barely move between refreshes; hold the last result for a
+# short window so repeated loads don't re-run the count queries.
+_STATS_CACHE: Dict[str, Any] = {"stats": None, "ts": 0.0}
+_STATS_TTL = 30.0
+
+def _count_rows(supabase, table: str, **filters) -> int:
+    """Run one count query (sync supabase client; called off the event loop).
+
+    head=True issues a HEAD request so PostgREST returns only the
+    Content-Range count header instead of streaming every id row back.
+    """
+    query = supabase.table(table).select("id", count="exact", head=True)
+    for column, value in filters.items():
+        query = query.eq(column, value)
+    return query.execute().count or 0
+
+async def _collect_dashboard_stats(supabase) -> Dict[str, Any]:
+    """Collect per-table counts concurrently (RPC fallback path).
+
+    The supabase client is synchronous, so each count runs in a worker
+    thread and asyncio.gather overlaps the round-trips; wall clock is the
+    slowest query instead of the sum of all six. Failed counts (e.g. a
+    table missing in this deployment) fall back to 0 like before.
+    """
+    results = await asyncio.gather(
+        asyncio.to_thread(_count_rows, supabase, "contacts"),
+        asyncio.to_thread(_count_rows, supabase, "contacts", status="unread"),
+        asyncio.to_thread(_count_rows, supabase, "services"),
+        asyncio.to_thread(_count_rows, supabase, "team_members"),
+        asyncio.to_thread(_count_rows, supabase, "portfolio"),
+        asyncio.to_thread(_count_rows, supabase, "testimonials"),
+        return_exceptions=True,
+    )
+    totals, unread, services, team, portfolio, testimonials = (
+        0 if isinstance(r, Exception) else r for r in results
+    )
+    return {
+        "total_messages": totals,
+        "unread_messages": unread,
+        "total_services": services,
+        "total_team_members": team,
+        "total_portfolio_projects": portfolio,
+        "total_testimonials": testimonials,
+    }
+
 @router.get("/")
 async def get_admin_info():
     """Get admin API information and available endpoints"""
@@ -26,55 +73,32 @@ async def get_admin_info():
 @router.get("/dashboard/stats")
 async def get_dashboard_stats(
     request: Request,
+    background_tasks: BackgroundTasks,
     current_user: dict = Depends(require_auth0_admin)
 ):
     """Get dashboard statistics (admin only)"""
     try:
-        supabase = get_supabase()
-        
-        # Get various counts
-        stats = {}
-        
-        # Contacts
-        try:
-            contact_result = supabase.table("contacts").select("id", count="exact").execute()
-            stats["total_messages"] = contact_result.count or 0
-            unread_result = supabase.table("contacts").select("id", count="exact").eq("status", 'unread').execute()
-            stats["unread_messages"] = unread_result.count or 0
-        except Exception:
-            stats["total_messages"] = 0
-            stats["unread_messages"] = 0
-        
-        # Services
-        try:
-            services_result = supabase.table("services").select("id", count="exact").execute()
-            stats["total_services"] = services_result.count or 0
-        except Exception:
-            stats["total_services"] = 0
-        
-        # Team members
-        try:
-            team_result = supabase.table("team_members").select("id", count="exact").execute()
-            stats["total_team_members"] = team_result.count or 0
-        except Exception:
-            stats["total_team_members"] = 0
-        
-        # Portfolio projects
-        try:
-            portfolio_result = supabase.table("portfolio").select("id", count="exact").execute()
-            stats["total_portfolio_projects"] = portfolio_result.count or 0
-        except Exception:
-            stats["total_portfolio_projects"] = 0
-        
-        # Testimonials
-        try:
-            testimonials_result = supabase.table("testimonials").select("id", count="exact").execute()
-            stats["total_testimonials"] = testimonials_result.count or 0
-        except Exception:
-            stats["total_testimonials"] = 0
-        
+        now = time.monotonic()
+        stats = _STATS_CACHE["stats"]
+        if stats is None or now - _STATS_CACHE["ts"] >= _STATS_TTL:
+            supabase = get_supabase()
+            # Prefer a single round-trip: the get_dashboard_counts RPC
+            # (db/migrations/0002) returns all counts in one SQL call, run
+            # off the event loop like every other sync supabase call. Fall
+            # back to per-table counts when the function isn't deployed yet.
+            try:
+                result = await asyncio.to_thread(
+                    supabase.rpc("get_dashboard_counts").execute
+                )
+                stats = result.data or {}
+            except Exception:
+                stats = await _collect_dashboard_stats(supabase)
+            _STATS_CACHE["stats"] = stats
+            _STATS_CACHE["ts"] = now
+
         # Log admin action
-        await log_admin_action(
+        background_tasks.add_task(
+            log_admin_action,
             request,
             current_user["email"],
             "view_dashboard_stats",
@@ -93,24 +117,58 @@ async def get_dashboard_stats(
 @router.get("/audit-log")
 async def get_audit_log(
     request: Request,
+    background_tasks: BackgroundTasks,
     current_user: dict = Depends(require_auth0_admin),
     limit: int = 100,
-    offset: int = 0
+    before_ts: str = None,
+    before_id: str = None
 ):
-    """Get admin audit log (admin only)"""
+    """Get admin audit log (admin only).
+
+    Pages by keyset on (timestamp, id): pass the returned next_before and
+    next_before_id back to fetch the next (older) page. The id tiebreaker
+    keeps rows that share a boundary timestamp from being dropped between
+    pages, and Postgres seeks the matching (timestamp DESC, id DESC) index
+    (db/migrations/0003) instead of scanning and discarding skipped rows.
+    """
     try:
         supabase = get_supabase()
-        result = supabase.table("admin_audit_logs").select("*").order("timestamp", desc=True).range(offset, offset + limit - 1).execute()
+        query = (
+            supabase.table("admin_audit_logs")
+            .select("*")
+            .order("timestamp", desc=True)
+            .order("id", desc=True)
+        )
+        if before_ts and before_id:
+            # Strictly before the (timestamp, id) cursor in descending order
+            query = query.or_(
+                f"timestamp.lt.{before_ts},and(timestamp.eq.{before_ts},id.lt.{before_id})"
+            )
+        elif before_ts:
+            # Legacy cursor without the tiebreaker
+            query = query.lt("timestamp", before_ts)
+        result = query.limit(limit).execute()
+        if len(result.data) == limit:
+            next_before = result.data[-1]["timestamp"]
+            next_before_id = result.data[-1]["id"]
+        else:
+            next_before = next_before_id = None
 
         # Log admin action
-        await log_admin_action(
+        background_tasks.add_task(
+            log_admin_action,
             request,
             current_user["email"],
             "view_audit_log",
             {"count": len(result.data)}
         )
 
-        return {"success": True, "logs": result.data}
+        return {
+            "success": True,
+            "logs": result.data,
+            "next_before": next_before,
+            "next_before_id": next_before_id,
+        }
         
     except Exception as e:
         logger.error(f"Audit log error: {e}")
@@ -122,6 +180,7 @@ async def get_audit_log(
 @router.get("/users")
 async def get_admin_users(
     request: Request,
+    background_tasks: BackgroundTasks,
     current_user: dict = Depends(require_auth0_admin)
 ):
     """Get admin users list (admin only)"""
@@ -131,7 +190,8 @@ async def get_admin_users(
         result = supabase.table("app_admins").select("id, email, created_at, last_login, is_active").execute()
         
         # Log admin action
-        await log_admin_action(
+        background_tasks.add_task(
+            log_admin_action,
             request,
             current_user["email"],
             "view_admin_users",
@@ -150,6 +210,7 @@ async def get_admin_users(
 @router.post("/users")
 async def create_admin_user(
     request: Request,
+    background_tasks: BackgroundTasks,
     user_data: Dict[str, Any],
     current_user: dict = Depends(require_auth0_admin)
 ):
@@ -176,7 +237,8 @@ async def create_admin_user(
             )
         
         # Log admin action
-        await log_admin_action(
+        background_tasks.add_task(
+            log_admin_action,
             request,
             current_user["email"],
             "create_admin_user",
@@ -198,6 +260,7 @@ async def create_admin_user(
 async def delete_admin_user(
     user_id: str,
     request: Request,
+    background_tasks: BackgroundTasks,
     current_user: dict = Depends(require_auth0_admin)
 ):
     """Delete admin user (admin only)"""
@@ -225,7 +288,8 @@ async def delete_admin_user(
         supabase.table("app_admins").delete().eq("id", user_id).execute()
 
         # Log admin action
-        await log_admin_action(
+        background_tasks.add_task(
+            log_admin_action,
             request,
             current_user["email"],
             "delete_admin_user",
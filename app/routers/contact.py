@@ -1,85 +1,87 @@
-from fastapi import APIRouter, HTTPException, Depends, Request, status
+from fastapi import APIRouter, HTTPException, Depends, Request, status, BackgroundTasks
 from app.models.content import ContactMessage, ContactResponse
 from app.core.auth0_security import require_auth0_admin as require_admin
 from app.core.security import log_admin_action
 from app.core.database import get_supabase, execute_query
 from app.core.config import settings  # Fix: required for REST fallback settings usage
 from typing import List, Optional
-import os, json, datetime
+import asyncio
+import os, json, time
 from app.services.email import send_resend_email, render_contact_email
-import httpx
+import aiofiles
 import logging
+from app.core.supabase_rest import client as _supabase_http
 
 logger = logging.getLogger(__name__)
+
+async def _ex(query):
+    """Run a sync supabase query in a worker thread so the loop stays free."""
+    return await asyncio.to_thread(query.execute)
+
 router = APIRouter()
 # Separate router for admin-compat endpoints mounted at /api (used by admin dashboard)
 admin_compat_router = APIRouter()
 
-# Mirror admin endpoints under the main router too, so clients using /contact/messages work in both apps
-@router.get("/messages")
-async def get_contact_messages_main(
-    request: Request,
-    current_user: dict = Depends(require_admin),
-    limit: int = 50,
-    offset: int = 0,
-    unread_only: bool = False
-):
-    try:
-        return await get_contact_messages(request, current_user, limit, offset, unread_only)  # type: ignore
-    except Exception as e:
-        logger.error(f"get_contact_messages_main error: {e}")
-        raise
+# REST fallback endpoint and headers are fixed by settings; build them once
+# so a fallback insert doesn't reconstruct the auth headers per call.
+_SUPABASE_KEY = settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_ANON_KEY
+_REST_CONTACTS_URL = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/contacts"
+_REST_HEADERS = {
+    "apikey": _SUPABASE_KEY,
+    "Authorization": f"Bearer {_SUPABASE_KEY}",
+    "Content-Type": "application/json",
+    "Prefer": "return=representation",
+}
+_REST_CONTACTS_LIST_URL = f"{_REST_CONTACTS_URL}?select=*&order=created_at.desc"
 
-@router.patch("/messages/{message_id}/read")
-async def mark_message_read_main(
-    message_id: str,
-    request: Request,
-    current_user: dict = Depends(require_admin)
-):
-    try:
-        return await mark_message_read(message_id, request, current_user)  # type: ignore
-    except Exception as e:
-        logger.error(f"mark_message_read_main error: {e}")
-        raise
+# Local fallback queue lives at the repo root; resolve the path once.
+_FALLBACK_PATH = os.path.join(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")),
+    "fallback_contacts.jsonl",
+)
 
-@router.delete("/messages/{message_id}")
-async def delete_contact_message_main(
-    message_id: str,
-    request: Request,
-    current_user: dict = Depends(require_admin)
-):
-    try:
-        return await delete_contact_message(message_id, request, current_user)  # type: ignore
-    except Exception as e:
-        logger.error(f"delete_contact_message_main error: {e}")
-        raise
+async def _write_contact_fallback(contact: ContactMessage) -> None:
+    """Append the submission to the local fallback queue (best-effort).
 
-@router.post("/", response_model=ContactResponse)
-async def submit_contact_form(request: Request, contact: ContactMessage):
-    """Submit contact form (public endpoint)
-    Resilient behavior: attempts DB insert and email independently.
-    Returns success if at least one path succeeds to avoid user-facing failures.
+    Uses aiofiles so a burst of fallback writes (DB and email both down)
+    doesn't serialize the event loop on disk I/O.
     """
-    # Capture client IP (best-effort)
     try:
-        contact.ip_address = request.client.host  # type: ignore[attr-defined]
-    except Exception:
-        pass
+        record = {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "ip": getattr(contact, "ip_address", None),
+            "name": contact.name,
+            "email": contact.email,
+            "message": contact.message,
+        }
+        async with aiofiles.open(_FALLBACK_PATH, "a", encoding="utf-8") as f:
+            await f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    except Exception as e:
+        logger.error(f"Failed to write contact fallback record: {e}")
+
+async def _persist_contact(contact: ContactMessage) -> bool:
+    """Save a contact submission: Supabase client, REST fallback, local queue.
 
+    Runs after the response is sent, so failures only log; the local jsonl
+    queue catches anything that couldn't be saved remotely.
+    """
     saved = False
-    emailed = False
 
-    # 1) Try to save to database (non-fatal on failure)
+    # One row dict shared by both insert paths
+    row = {
+        "name": contact.name,
+        "email": contact.email,
+        "subject": contact.subject or "General Inquiry",  # Provide default if no subject
+        "message": contact.message,
+        "status": "unread",
+        "ip_address": contact.ip_address,
+    }
+
+    # 1) Try to save to database (non-fatal on failure). The supabase client
+    # is synchronous, so run it in a worker thread to keep the loop free.
     try:
         supabase = get_supabase()
-        result = supabase.table("contacts").insert({
-            "name": contact.name,
-            "email": contact.email,
-            "subject": contact.subject or "General Inquiry",  # Provide default if no subject
-            "message": contact.message,
-            "status": "unread",
-            "ip_address": contact.ip_address,
-        }).execute()
+        result = await asyncio.to_thread(supabase.table("contacts").insert(row).execute)
         saved = bool(result.data)
         if not saved:
             logger.error("Contact save returned empty result.data")
@@ -89,32 +91,21 @@ async def submit_contact_form(request: Request, contact: ContactMessage):
     # 1b) Fallback: use Supabase REST API directly if not saved
     if not saved:
         try:
-            base = settings.SUPABASE_URL.rstrip('/')
-            url = f"{base}/rest/v1/contacts"
-            headers = {
-                "apikey": settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_ANON_KEY,
-                "Authorization": f"Bearer {settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_ANON_KEY}",
-                "Content-Type": "application/json",
-                "Prefer": "return=representation",
-            }
-            payload = {
-                "name": contact.name,
-                "email": contact.email,
-                "subject": contact.subject or "General Inquiry",
-                "message": contact.message,
-                "status": "unread",
-                "ip_address": contact.ip_address,
-            }
-            async with httpx.AsyncClient(timeout=10) as client:
-                resp = await client.post(url, headers=headers, json=payload)
-                if resp.status_code in (200, 201):
-                    saved = True
-                else:
-                    logger.error(f"Supabase REST insert failed [{resp.status_code}]: {resp.text}")
+            resp = await _supabase_http.post(_REST_CONTACTS_URL, headers=_REST_HEADERS, json=row)
+            if resp.status_code in (200, 201):
+                saved = True
+            else:
+                logger.error(f"Supabase REST insert failed [{resp.status_code}]: {resp.text}")
         except Exception as e:
             logger.error(f"Supabase REST fallback failed: {e}")
 
-    # 2) Try to send email notification (non-fatal on failure)
+    if not saved:
+        logger.error("Contact save failed on all remote paths; writing to local fallback queue")
+        await _write_contact_fallback(contact)
+    return saved
+
+async def _notify_contact(contact: ContactMessage) -> bool:
+    """Send the email notification for a contact submission (non-fatal)."""
     try:
         html = render_contact_email(contact.name, contact.email, contact.message)
         emailed = await send_resend_email(
@@ -123,26 +114,38 @@ async def submit_contact_form(request: Request, contact: ContactMessage):
         )
         if not emailed:
             logger.error("Contact email send returned False")
+        return emailed
     except Exception as e:
         logger.exception(f"Contact email notification failed (non-fatal): {e}")
+        return False
 
-    # 3) If both failed, persist to a local fallback file (best-effort) and still return success to user
-    if not (saved or emailed):
-        logger.error("Contact submission failed: neither DB save nor email succeeded; writing to local fallback queue")
-        try:
-            base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
-            path = os.path.join(base_dir, "fallback_contacts.jsonl")
-            record = {
-                "timestamp": datetime.datetime.utcnow().isoformat() + "Z",
-                "ip": getattr(contact, "ip_address", None),
-                "name": contact.name,
-                "email": contact.email,
-                "message": contact.message,
-            }
-            with open(path, "a", encoding="utf-8") as f:
-                f.write(json.dumps(record, ensure_ascii=False) + "\n")
-        except Exception as e:
-            logger.error(f"Failed to write contact fallback record: {e}")
+async def _process_contact(contact: ContactMessage) -> None:
+    """Persist and notify concurrently; the two paths share no state.
+
+    Starlette runs queued background tasks one after another, so a single
+    gathered task is what actually overlaps the DB insert with the email
+    send (wall time is max of the two instead of their sum).
+    """
+    await asyncio.gather(
+        _persist_contact(contact),
+        _notify_contact(contact),
+        return_exceptions=True,
+    )
+
+@router.post("/", response_model=ContactResponse)
+async def submit_contact_form(request: Request, contact: ContactMessage, background: BackgroundTasks):
+    """Submit contact form (public endpoint)
+    Resilient behavior: attempts DB insert and email independently.
+    Both run as background tasks so the user gets the success response
+    immediately; failures land in the local fallback queue.
+    """
+    # Capture client IP (best-effort)
+    try:
+        contact.ip_address = request.client.host  # type: ignore[attr-defined]
+    except Exception:
+        pass
+
+    background.add_task(_process_contact, contact)
 
     return ContactResponse(
         success=True,
@@ -152,12 +155,15 @@ async def submit_contact_form(request: Request, contact: ContactMessage):
 # Alias without trailing slash so clients posting to /api/contact (no slash)
 # don't hit a 405 due to strict slash handling on POST.
 @router.post("", response_model=ContactResponse)
-async def submit_contact_form_no_slash(request: Request, contact: ContactMessage):
-    return await submit_contact_form(request, contact)
+async def submit_contact_form_no_slash(request: Request, contact: ContactMessage, background: BackgroundTasks):
+    return await submit_contact_form(request, contact, background)
 
-@router.get("/messages", response_model=List[ContactMessage])
+# No response_model here: the shadowed duplicate route used to win matching
+# and served the untrimmed rows, so clients rely on the extra columns.
+@router.get("/messages")
 async def get_contact_messages(
     request: Request,
+    background_tasks: BackgroundTasks,
     current_user: dict = Depends(require_admin),
     limit: int = 50,
     offset: int = 0,
@@ -171,20 +177,20 @@ async def get_contact_messages(
         if unread_only:
             query = query.eq("status", "unread")
             
-        result = query.order("created_at", desc=True).range(offset, offset + limit - 1).execute()
+        result = await _ex(query.order("created_at", desc=True).range(offset, offset + limit - 1))
         
-        # Transform data to match admin panel expectations
-        transformed_data = []
-        for message in result.data:
-            transformed_message = {
-                **message,
-                "is_read": message.get("status") == "read",  # Convert status to is_read boolean
-                "subject": message.get("subject") or "General Inquiry"  # Ensure subject exists
-            }
-            transformed_data.append(transformed_message)
+        # Transform data to match admin panel expectations. The rows aren't
+        # used again after this, so mutate in place instead of copying each
+        # dict via **spread.
+        transformed_data = result.data
+        for message in transformed_data:
+            message["is_read"] = message.get("status") == "read"  # Convert status to is_read boolean
+            if not message.get("subject"):
+                message["subject"] = "General Inquiry"  # Ensure subject exists
         
         # Log admin action
-        await log_admin_action(
+        background_tasks.add_task(
+            log_admin_action,
             request,
             current_user["email"],
             "view_contact_messages",
@@ -204,14 +210,15 @@ async def get_contact_messages(
 async def mark_message_read(
     message_id: str,
     request: Request,
+    background_tasks: BackgroundTasks,
     current_user: dict = Depends(require_admin)
 ):
     """Mark contact message as read (admin only)"""
     try:
         supabase = get_supabase()
-        result = supabase.table("contacts").update({
+        result = await _ex(supabase.table("contacts").update({
             "status": "read",
-        }).eq("id", message_id).execute()
+        }).eq("id", message_id))
         
         if not result.data:
             raise HTTPException(
@@ -220,7 +227,8 @@ async def mark_message_read(
             )
         
         # Log admin action
-        await log_admin_action(
+        background_tasks.add_task(
+            log_admin_action,
             request,
             current_user["email"],
             "mark_message_read",
@@ -242,12 +250,13 @@ async def mark_message_read(
 async def delete_contact_message(
     message_id: str,
     request: Request,
+    background_tasks: BackgroundTasks,
     current_user: dict = Depends(require_admin)
 ):
     """Delete contact message (admin only)"""
     try:
         supabase = get_supabase()
-        result = supabase.table("contacts").delete().eq("id", message_id).execute()
+        result = await _ex(supabase.table("contacts").delete().eq("id", message_id))
         
         if not result.data:
             raise HTTPException(
@@ -256,7 +265,8 @@ async def delete_contact_message(
             )
         
         # Log admin action
-        await log_admin_action(
+        background_tasks.add_task(
+            log_admin_action,
             request,
             current_user["email"],
             "delete_contact_message",
@@ -281,9 +291,19 @@ async def admin_list_contacts(
     current_user: dict = Depends(require_admin)
 ):
     """GET /api/contacts -> list contacts (admin only)"""
+    # The query never varies, so hit PostgREST directly over the pooled
+    # client with a pre-built URL instead of re-assembling the supabase-py
+    # builder chain per request. The builder path stays as the fallback.
+    try:
+        resp = await _supabase_http.get(_REST_CONTACTS_LIST_URL, headers=_REST_HEADERS)
+        if resp.status_code == 200:
+            return resp.json()
+        logger.error(f"Admin list contacts REST failed [{resp.status_code}]: {resp.text}")
+    except Exception as e:
+        logger.error(f"Admin list contacts REST error: {e}")
     try:
         supabase = get_supabase()
-        result = supabase.table("contacts").select("*").order("created_at", desc=True).execute()
+        result = await _ex(supabase.table("contacts").select("*").order("created_at", desc=True))
         return result.data or []
     except Exception as e:
         logger.error(f"Admin list contacts error: {e}")
@@ -308,7 +328,7 @@ async def admin_update_contact(
             update_data["response_notes"] = payload.get("response_notes")
         if payload.get("status") == "read":
             update_data["responded_at"] = "now()"
-        result = supabase.table("contacts").update(update_data).eq("id", contact_id).select("*").execute()
+        result = await _ex(supabase.table("contacts").update(update_data).eq("id", contact_id).select("*"))
         if not result.data:
             raise HTTPException(status_code=404, detail="Contact not found")
         return result.data[0]
@@ -327,7 +347,7 @@ async def admin_delete_contact(
     """DELETE /api/contacts?id=... (admin only)"""
     try:
         supabase = get_supabase()
-        supabase.table("contacts").delete().eq("id", id).execute()
+        await _ex(supabase.table("contacts").delete().eq("id", id))
         return {"success": True}
     except Exception as e:
         logger.error(f"Admin delete contact error: {e}")
@@ -1,13 +1,56 @@
-from fastapi import APIRouter, HTTPException, Depends, Request, status
+from fastapi import APIRouter, HTTPException, Depends, Request, Response, status, BackgroundTasks
+from fastapi.responses import ORJSONResponse
 from app.models.content import AboutContent
 from app.core.auth0_security import require_auth0_admin as require_admin
 from app.core.security import log_admin_action
 from app.core.database import get_supabase
+from cachetools import TTLCache
+import asyncio
+import hashlib
 import logging
+import orjson
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+async def _ex(query):
+    """Run a sync supabase query in a worker thread so the loop stays free."""
+    return await asyncio.to_thread(query.execute)
+
+# Public content is read-mostly; hold each section's response for a minute so
+# repeat hits are a dict lookup instead of a Supabase round-trip. Admin writes
+# in this module invalidate their section immediately; writes from the
+# dedicated CRUD routers are bounded by the TTL. Only touched on the event
+# loop, so no lock is needed. Entries are (payload, etag) pairs; the weak
+# ETag is computed once when a payload enters the cache.
+_content_cache: TTLCache = TTLCache(maxsize=64, ttl=60)
+
+_CACHE_CONTROL = "public, max-age=60, stale-while-revalidate=300"
+
+# The about table holds a single row; remember its id so updates don't pay a
+# SELECT round-trip before every UPDATE.
+_about_row_id = None
+
+def _cache_entry(key: str, payload: dict) -> tuple:
+    etag = 'W/"' + hashlib.md5(orjson.dumps(payload)).hexdigest() + '"'
+    entry = (payload, etag)
+    _content_cache[key] = entry
+    return entry
+
+def _respond(request, entry):
+    """Serve a cached (payload, etag) entry with browser/CDN cache headers.
+
+    Called with request=None for internal composition (the bundle endpoint),
+    which just wants the payload dict.
+    """
+    payload, etag = entry
+    if request is None:
+        return payload
+    headers = {"ETag": etag, "Cache-Control": _CACHE_CONTROL}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return ORJSONResponse(payload, headers=headers)
+
 @router.get("/")
 async def get_content_info():
     """Get content API information and available endpoints"""
@@ -24,75 +67,91 @@ async def get_content_info():
     }
 
 @router.get("/about")
-async def get_about_content():
+async def get_about_content(request: Request = None):
     """Get about page content (public endpoint)"""
-    try:
-        supabase = get_supabase()
-        # In provided schema, about has fields: content, created_at, updated_at
-        result = (
-            supabase
-            .table("about")
-            .select("*")
-            .order("updated_at", desc=True)
-            .limit(1)
-            .execute()
-        )
-
-        if result.data:
-            return {"success": True, "about": result.data[0]}
-        else:
-            # Default/fallback content
-            return {
-                "success": True,
-                "about": {
-                    "content": (
-                        "We are a technology company focused on delivering innovative solutions."
-                    ),
-                    "mission": "To provide cutting-edge technology solutions that drive business growth.",
-                    "vision": "To be the leading technology partner for businesses worldwide.",
-                    "values": ["Innovation", "Quality", "Customer Focus", "Integrity"],
-                },
-            }
+    entry = _content_cache.get("about")
+    if entry is None:
+        try:
+            supabase = get_supabase()
+            # In provided schema, about has fields: content, created_at, updated_at
+            result = await _ex(
+                supabase
+                .table("about")
+                .select("*")
+                .order("updated_at", desc=True)
+                .limit(1)
+            )
 
-    except Exception as e:
-        logger.error(f"Get about content error: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to retrieve about content",
-        )
+            if result.data:
+                payload = {"success": True, "about": result.data[0]}
+            else:
+                # Default/fallback content
+                payload = {
+                    "success": True,
+                    "about": {
+                        "content": (
+                            "We are a technology company focused on delivering innovative solutions."
+                        ),
+                        "mission": "To provide cutting-edge technology solutions that drive business growth.",
+                        "vision": "To be the leading technology partner for businesses worldwide.",
+                        "values": ["Innovation", "Quality", "Customer Focus", "Integrity"],
+                    },
+                }
+            entry = _cache_entry("about", payload)
+
+        except Exception as e:
+            logger.error(f"Get about content error: {e}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to retrieve about content",
+            )
+    return _respond(request, entry)
 
 @router.put("/about")
 async def update_about_content(
-    request: Request, about: AboutContent, current_user: dict = Depends(require_admin)
+    request: Request, background_tasks: BackgroundTasks, about: AboutContent, current_user: dict = Depends(require_admin)
 ):
     """Update about page content (admin only)"""
+    global _about_row_id
     try:
         supabase = get_supabase()
 
-        # Check if content exists
-        existing = supabase.table("about").select("id").limit(1).execute()
-
         about_data = {
             # schema has only content; keep extra fields if present
             "content": about.content,
             "updated_at": "now()",
         }
 
-        if existing.data:
-            result = (
-                supabase.table("about").update(about_data).eq("id", existing.data[0]["id"]).execute()
+        # Resolve the singleton row id once; subsequent updates go straight
+        # to UPDATE without the existence check.
+        if _about_row_id is None:
+            existing = await _ex(supabase.table("about").select("id").limit(1))
+            if existing.data:
+                _about_row_id = existing.data[0]["id"]
+
+        if _about_row_id is not None:
+            result = await _ex(
+                supabase.table("about").update(about_data).eq("id", _about_row_id)
             )
+            if not result.data:
+                # Row vanished since we cached its id; fall back to insert
+                _about_row_id = None
+                result = await _ex(supabase.table("about").insert(about_data))
         else:
-            result = supabase.table("about").insert(about_data).execute()
+            result = await _ex(supabase.table("about").insert(about_data))
 
         if not result.data:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Failed to update about content",
             )
+        _about_row_id = result.data[0].get("id", _about_row_id)
+
+        _content_cache.pop("about", None)
 
         # Log admin action
-        await log_admin_action(
+        background_tasks.add_task(
+            log_admin_action,
             request, current_user["email"], "update_about_content", {"content_len": len(about.content)}
         )
 
@@ -110,138 +169,181 @@ async def update_about_content(
 # ===== Public content endpoints to mirror Next.js routes =====
 
 @router.get("/services")
-async def public_services():
+async def public_services(request: Request = None):
     """GET /api/content/services -> { services: [...] }"""
-    try:
-        supabase = get_supabase()
-        result = (
-            supabase
-            .table("services")
-            .select("*")
-            .eq("is_active", True)
-            .order("created_at", desc=True)
-            .execute()
-        )
-        return {"services": result.data or []}
-    except Exception as e:
-        logger.error(f"Public services error: {e}")
-        return {"services": []}
+    entry = _content_cache.get("services")
+    if entry is None:
+        try:
+            supabase = get_supabase()
+            result = await _ex(
+                supabase
+                .table("services")
+                .select("*")
+                .eq("is_active", True)
+                .order("created_at", desc=True)
+            )
+            entry = _cache_entry("services", {"services": result.data or []})
+        except Exception as e:
+            logger.error(f"Public services error: {e}")
+            return {"services": []}
+    return _respond(request, entry)
 
 @router.get("/team")
-async def public_team():
+async def public_team(request: Request = None):
     """GET /api/content/team -> { team: [...] }"""
-    try:
-        supabase = get_supabase()
-        result = (
-            supabase
-            .table("team_members")
-            .select("*")
-            .eq("active", True)
-            .order("order", desc=False)
-            .execute()
-        )
-        return {"team": result.data or []}
-    except Exception as e:
-        logger.error(f"Public team error: {e}")
-        return {"team": []}
+    entry = _content_cache.get("team")
+    if entry is None:
+        try:
+            supabase = get_supabase()
+            result = await _ex(
+                supabase
+                .table("team_members")
+                .select("*")
+                .eq("active", True)
+                .order("order", desc=False)
+            )
+            entry = _cache_entry("team", {"team": result.data or []})
+        except Exception as e:
+            logger.error(f"Public team error: {e}")
+            return {"team": []}
+    return _respond(request, entry)
 
 @router.get("/portfolio")
-async def public_portfolio():
+async def public_portfolio(request: Request = None):
     """GET /api/content/portfolio -> { portfolio: [...] }"""
+    entry = _content_cache.get("portfolio")
+    if entry is not None:
+        return _respond(request, entry)
     try:
         supabase = get_supabase()
-        # Fetch recent rows and filter in Python to allow both is_active and active flags
-        result = (
-            supabase
-            .table("portfolio")
-            .select("*")
-            .order("display_order", desc=False)
-            .order("created_at", desc=True)
-            .limit(100)
-            .execute()
-        )
+        try:
+            # Filter server-side: either active flag set, and status not
+            # hidden (null status counts as visible, matching the old Python
+            # filter). PostgREST ANDs the two or= groups, so only matching
+            # rows are transferred and serialized.
+            result = await _ex(
+                supabase
+                .table("portfolio")
+                .select("*")
+                .or_("is_active.is.true,active.is.true")
+                .or_("status.is.null,status.not.in.(draft,archived,deleted)")
+                .order("display_order", desc=False)
+                .order("created_at", desc=True)
+                .limit(100)
+            )
+            rows = result.data or []
+        except Exception:
+            # Legacy schemas may lack any of the referenced columns, which
+            # 400s the filtered query; fetch unfiltered and apply the
+            # original tolerant Python-side flag logic instead
+            result = await _ex(
+                supabase
+                .table("portfolio")
+                .select("*")
+                .order("display_order", desc=False)
+                .order("created_at", desc=True)
+                .limit(100)
+            )
+            rows = [
+                row for row in (result.data or [])
+                if not (("is_active" in row or "active" in row)
+                        and row.get("is_active") is not True
+                        and row.get("active") is not True)
+            ]
+
+        # PostgREST's in.() match is case-sensitive, so re-check status with
+        # the old normalization ("Draft" must stay hidden); the set is at
+        # most 100 rows here, so this costs nothing
+        items = [
+            row for row in rows
+            if (row.get("status") or "").lower() not in {"draft", "archived", "deleted"}
+        ]
 
-        rows = result.data or []
-        items = []
-        for row in rows:
-            # Determine inclusion using flexible active flags logic:
-            # - If either is_active or active is True -> include
-            # - If both are present and neither is True -> exclude
-            # - If neither field exists -> include (assume visible)
-            has_is = "is_active" in row
-            has_active = "active" in row
-            if has_is or has_active:
-                is_true = (row.get("is_active") is True) or (row.get("active") is True)
-                if not is_true:
-                    continue
-            # Status: exclude drafts/archived/deleted if provided
-            status = (row.get("status") or "").lower()
-            if status in {"draft", "archived", "deleted"}:
-                continue
-            items.append(row)
-
-        return {"portfolio": items}
+        entry = _cache_entry("portfolio", {"portfolio": items})
+        return _respond(request, entry)
     except Exception as e:
         logger.error(f"Public portfolio error: {e}")
         return {"portfolio": []}
 
 @router.get("/faq")
-async def public_faq():
+async def public_faq(request: Request = None):
     """GET /api/content/faq -> { faqs: [...] }"""
-    try:
-        supabase = get_supabase()
-        result = (
-            supabase
-            .table("faqs")
-            .select("*")
-            .eq("active", True)
-            .order("order", desc=False)
-            .order("updated_at", desc=True)
-            .execute()
-        )
-        return {"faqs": result.data or []}
-    except Exception as e:
-        logger.error(f"Public FAQ error: {e}")
-        return {"faqs": []}
+    entry = _content_cache.get("faq")
+    if entry is None:
+        try:
+            supabase = get_supabase()
+            result = await _ex(
+                supabase
+                .table("faqs")
+                .select("*")
+                .eq("active", True)
+                .order("order", desc=False)
+                .order("updated_at", desc=True)
+            )
+            entry = _cache_entry("faq", {"faqs": result.data or []})
+        except Exception as e:
+            logger.error(f"Public FAQ error: {e}")
+            return {"faqs": []}
+    return _respond(request, entry)
 
 @router.get("/testimonials")
-async def public_testimonials():
+async def public_testimonials(request: Request = None):
     """GET /api/content/testimonials -> { testimonials: [...] }"""
-    try:
-        supabase = get_supabase()
-        result = (
-            supabase
-            .table("testimonials")
-            .select("*")
-            .eq("is_active", True)
-            .order("order", desc=False)
-            .execute()
-        )
-        data = result.data or []
-        # Fallback to `active` flag if `is_active` not set
-        if not data:
-            try:
-                result = (
-                    supabase
-                    .table("testimonials")
-                    .select("*")
-                    .eq("active", True)
-                    .order("order", desc=False)
-                    .execute()
-                )
-                data = result.data or []
-            except Exception:
-                data = []
-        return {"testimonials": data}
-    except Exception as e:
-        logger.error(f"Public testimonials error: {e}")
-        return {"testimonials": []}
+    entry = _content_cache.get("testimonials")
+    if entry is None:
+        try:
+            supabase = get_supabase()
+            result = await _ex(
+                supabase
+                .table("testimonials")
+                .select("*")
+                .eq("is_active", True)
+                .order("order", desc=False)
+            )
+            data = result.data or []
+            # Fallback to `active` flag if `is_active` not set
+            if not data:
+                try:
+                    result = await _ex(
+                        supabase
+                        .table("testimonials")
+                        .select("*")
+                        .eq("active", True)
+                        .order("order", desc=False)
+                    )
+                    data = result.data or []
+                except Exception:
+                    data = []
+            entry = _cache_entry("testimonials", {"testimonials": data})
+        except Exception as e:
+            logger.error(f"Public testimonials error: {e}")
+            return {"testimonials": []}
+    return _respond(request, entry)
+
+@router.get("/bundle")
+async def public_bundle():
+    """GET /api/content/bundle -> all public content in one response.
+
+    A homepage render needs most of these sections; fetching them in one
+    request costs the client a single round-trip instead of five. Each
+    section keeps its own error fallback, so a failed query degrades to
+    its empty default without failing the bundle.
+    """
+    services, team, portfolio, faqs, testimonials = await asyncio.gather(
+        public_services(),
+        public_team(),
+        public_portfolio(),
+        public_faq(),
+        public_testimonials(),
+    )
+    return {**services, **team, **portfolio, **faqs, **testimonials}
 
 # ===== CRUD operations for admin dashboard =====
 
 @router.post("/portfolio")
 async def create_portfolio_item(
     request: Request,
+    background_tasks: BackgroundTasks,
     portfolio_data: dict,
     current_user: dict = Depends(require_admin)
 ):
@@ -254,14 +356,16 @@ async def create_portfolio_item(
             return {"success": True, "message": "Cache invalidated"}
         
         # Handle actual creation
-        result = supabase.table("portfolio").insert(portfolio_data).execute()
+        result = await _ex(supabase.table("portfolio").insert(portfolio_data))
         if not result.data:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Failed to create portfolio item"
             )
         
-        await log_admin_action(
+        _content_cache.pop("portfolio", None)
+        background_tasks.add_task(
+            log_admin_action,
             request, 
             current_user["email"], 
             "create_portfolio_item", 
@@ -282,6 +386,7 @@ async def create_portfolio_item(
 async def update_portfolio_item(
     item_id: str,
     request: Request,
+    background_tasks: BackgroundTasks,
     portfolio_data: dict,
     current_user: dict = Depends(require_admin)
 ):
@@ -289,14 +394,16 @@ async def update_portfolio_item(
     try:
         supabase = get_supabase()
         
-        result = supabase.table("portfolio").update(portfolio_data).eq("id", item_id).execute()
+        result = await _ex(supabase.table("portfolio").update(portfolio_data).eq("id", item_id))
         if not result.data:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Portfolio item not found"
             )
         
-        await log_admin_action(
+        _content_cache.pop("portfolio", None)
+        background_tasks.add_task(
+            log_admin_action,
             request,
             current_user["email"], 
             "update_portfolio_item",
@@ -317,20 +424,23 @@ async def update_portfolio_item(
 async def delete_portfolio_item(
     item_id: str,
     request: Request,
+    background_tasks: BackgroundTasks,
     current_user: dict = Depends(require_admin)
 ):
     """DELETE /api/content/portfolio/{id} -> delete portfolio item (admin only)"""
     try:
         supabase = get_supabase()
         
-        result = supabase.table("portfolio").delete().eq("id", item_id).execute()
+        result = await _ex(supabase.table("portfolio").delete().eq("id", item_id))
         if not result.data:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Portfolio item not found"
             )
         
-        await log_admin_action(
+        _content_cache.pop("portfolio", None)
+        background_tasks.add_task(
+            log_admin_action,
             request,
             current_user["email"],
             "delete_portfolio_item", 
@@ -350,6 +460,7 @@ async def delete_portfolio_item(
 @router.post("/team")
 async def create_team_member(
     request: Request,
+    background_tasks: BackgroundTasks,
     team_data: dict,
     current_user: dict = Depends(require_admin)
 ):
@@ -357,14 +468,16 @@ async def create_team_member(
     try:
         supabase = get_supabase()
         
-        result = supabase.table("team_members").insert(team_data).execute()
+        result = await _ex(supabase.table("team_members").insert(team_data))
         if not result.data:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Failed to create team member"
             )
         
-        await log_admin_action(
+        _content_cache.pop("team", None)
+        background_tasks.add_task(
+            log_admin_action,
             request,
             current_user["email"],
             "create_team_member",
@@ -385,6 +498,7 @@ async def create_team_member(
 async def update_team_member(
     member_id: str,
     request: Request,
+    background_tasks: BackgroundTasks,
     team_data: dict,
     current_user: dict = Depends(require_admin)
 ):
@@ -392,14 +506,16 @@ async def update_team_member(
     try:
         supabase = get_supabase()
         
-        result = supabase.table("team_members").update(team_data).eq("id", member_id).execute()
+        result = await _ex(supabase.table("team_members").update(team_data).eq("id", member_id))
         if not result.data:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Team member not found"
             )
         
-        await log_admin_action(
+        _content_cache.pop("team", None)
+        background_tasks.add_task(
+            log_admin_action,
             request,
             current_user["email"],
             "update_team_member",
@@ -420,20 +536,23 @@ async def update_team_member(
 async def delete_team_member(
     member_id: str,
     request: Request,
+    background_tasks: BackgroundTasks,
     current_user: dict = Depends(require_admin)
 ):
     """DELETE /api/content/team/{id} -> delete team member (admin only)"""
     try:
         supabase = get_supabase()
         
-        result = supabase.table("team_members").delete().eq("id", member_id).execute()
+        result = await _ex(supabase.table("team_members").delete().eq("id", member_id))
         if not result.data:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Team member not found"
             )
         
-        await log_admin_action(
+        _content_cache.pop("team", None)
+        background_tasks.add_task(
+            log_admin_action,
             request,
             current_user["email"],
             "delete_team_member",
@@ -453,6 +572,7 @@ async def delete_team_member(
 @router.post("/testimonials")
 async def create_testimonial(
     request: Request,
+    background_tasks: BackgroundTasks,
     testimonial_data: dict,
     current_user: dict = Depends(require_admin)
 ):
@@ -460,14 +580,16 @@ async def create_testimonial(
     try:
         supabase = get_supabase()
         
-        result = supabase.table("testimonials").insert(testimonial_data).execute()
+        result = await _ex(supabase.table("testimonials").insert(testimonial_data))
         if not result.data:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Failed to create testimonial"
             )
         
-        await log_admin_action(
+        _content_cache.pop("testimonials", None)
+        background_tasks.add_task(
+            log_admin_action,
             request,
             current_user["email"],
             "create_testimonial",
@@ -488,6 +610,7 @@ async def create_testimonial(
 async def update_testimonial(
     testimonial_id: str,
     request: Request,
+    background_tasks: BackgroundTasks,
     testimonial_data: dict,
     current_user: dict = Depends(require_admin)
 ):
@@ -495,14 +618,16 @@ async def update_testimonial(
     try:
         supabase = get_supabase()
         
-        result = supabase.table("testimonials").update(testimonial_data).eq("id", testimonial_id).execute()
+        result = await _ex(supabase.table("testimonials").update(testimonial_data).eq("id", testimonial_id))
         if not result.data:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Testimonial not found"
             )
         
-        await log_admin_action(
+        _content_cache.pop("testimonials", None)
+        background_tasks.add_task(
+            log_admin_action,
             request,
             current_user["email"],
             "update_testimonial",
@@ -523,20 +648,23 @@ async def update_testimonial(
 async def delete_testimonial(
     testimonial_id: str,
     request: Request,
+    background_tasks: BackgroundTasks,
     current_user: dict = Depends(require_admin)
 ):
     """DELETE /api/content/testimonials/{id} -> delete testimonial (admin only)"""
     try:
         supabase = get_supabase()
         
-        result = supabase.table("testimonials").delete().eq("id", testimonial_id).execute()
+        result = await _ex(supabase.table("testimonials").delete().eq("id", testimonial_id))
         if not result.data:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Testimonial not found"
             )
         
-        await log_admin_action(
+        _content_cache.pop("testimonials", None)
+        background_tasks.add_task(
+            log_admin_action,
             request,
             current_user["email"],
             "delete_testimonial",
@@ -556,6 +684,7 @@ async def delete_testimonial(
 @router.post("/faq")
 async def create_faq(
     request: Request,
+    background_tasks: BackgroundTasks,
     faq_data: dict,
     current_user: dict = Depends(require_admin)
 ):
@@ -563,14 +692,16 @@ async def create_faq(
     try:
         supabase = get_supabase()
         
-        result = supabase.table("faqs").insert(faq_data).execute()
+        result = await _ex(supabase.table("faqs").insert(faq_data))
         if not result.data:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Failed to create FAQ"
             )
         
-        await log_admin_action(
+        _content_cache.pop("faq", None)
+        background_tasks.add_task(
+            log_admin_action,
             request,
             current_user["email"],
             "create_faq",
@@ -591,6 +722,7 @@ async def create_faq(
 async def update_faq(
     faq_id: str,
     request: Request,
+    background_tasks: BackgroundTasks,
     faq_data: dict,
     current_user: dict = Depends(require_admin)
 ):
@@ -598,14 +730,16 @@ async def update_faq(
     try:
         supabase = get_supabase()
         
-        result = supabase.table("faqs").update(faq_data).eq("id", faq_id).execute()
+        result = await _ex(supabase.table("faqs").update(faq_data).eq("id", faq_id))
         if not result.data:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="FAQ not found"
             )
         
-        await log_admin_action(
+        _content_cache.pop("faq", None)
+        background_tasks.add_task(
+            log_admin_action,
             request,
             current_user["email"],
             "update_faq",
@@ -626,20 +760,23 @@ async def update_faq(
 async def delete_faq(
     faq_id: str,
     request: Request,
+    background_tasks: BackgroundTasks,
     current_user: dict = Depends(require_admin)
 ):
     """DELETE /api/content/faq/{id} -> delete FAQ (admin only)"""
     try:
         supabase = get_supabase()
         
-        result = supabase.table("faqs").delete().eq("id", faq_id).execute()
+        result = await _ex(supabase.table("faqs").delete().eq("id", faq_id))
         if not result.data:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="FAQ not found"
             )
         
-        await log_admin_action(
+        _content_cache.pop("faq", None)
+        background_tasks.add_task(
+            log_admin_action,
             request,
             current_user["email"],
             "delete_faq",
@@ -1,13 +1,27 @@
-from fastapi import APIRouter, HTTPException, Depends, Request, status
-from app.models.content import FAQ
+from fastapi import APIRouter, HTTPException, Depends, Request, status, BackgroundTasks
+from fastapi.responses import ORJSONResponse, Response
+from app.models.content import FAQ, BulkDeleteRequest
 from app.core.auth0_security import require_auth0_admin as require_admin
 from app.core.security import log_admin_action
 from app.core.database import get_supabase
+from app.core import response_cache, singleflight, supabase_rest
 from typing import List
+import asyncio
+import hashlib
 import logging
+import orjson
 
 logger = logging.getLogger(__name__)
-router = APIRouter()
+# orjson for anything not already returned as pre-serialized bytes
+router = APIRouter(default_response_class=ORJSONResponse)
+
+async def _ex(query):
+    """Run a blocking supabase-py .execute() off the event loop."""
+    return await asyncio.to_thread(query.execute)
+
+def _truncate(s: str, n: int = 50) -> str:
+    """Shorten a string for audit-log details."""
+    return s if len(s) <= n else s[:n] + "..."
 
 # Default FAQs (maintaining compatibility with existing system)
 DEFAULT_FAQS = [
@@ -45,33 +59,72 @@ DEFAULT_FAQS = [
     }
 ]
 
-@router.get("/", response_model=List[FAQ])
-async def get_faqs():
-    """Get all FAQs (public endpoint)"""
+# The defaults never change at runtime; serialize them once at import so the
+# fallback path is a plain bytes copy instead of a per-request encode.
+_DEFAULT_FAQS_BYTES = orjson.dumps(DEFAULT_FAQS)
+_DEFAULT_FAQS_HEADERS = {
+    "ETag": '"' + hashlib.blake2b(_DEFAULT_FAQS_BYTES, digest_size=16).hexdigest() + '"',
+    "Cache-Control": "public, max-age=300",
+    "Vary": "Accept-Encoding",
+}
+
+# Prebuilt PostgREST URL for the hot list query; its shape never changes
+# at runtime, so skip supabase-py's per-call builder allocations.
+_REST_LIST_URL = supabase_rest.table_url(
+    "faqs", "select=*&is_active=eq.true&order=order.asc"
+)
+
+async def _fetch_faqs():
+    """Query and cache the FAQ list; None means serve the defaults."""
+    try:
+        resp = await supabase_rest.client.get(_REST_LIST_URL, headers=supabase_rest.HEADERS)
+        if resp.status_code == 200:
+            if resp.content != b"[]":
+                # Upstream body is already the JSON we serve; cache the raw
+                # bytes and skip the decode/encode round trip
+                return response_cache.put_bytes("faqs", resp.content)
+            # No FAQs in database; defaults stay uncached so a recovering
+            # table is picked up immediately
+            return None
+    except Exception:
+        pass  # network hiccup; retry via the supabase-py client
+
     try:
         supabase = get_supabase()
-        
+
         try:
-            result = supabase.table("faqs").select("*").eq("is_active", True).order("order").execute()
-            
+            result = await _ex(supabase.table("faqs").select("*").eq("is_active", True).order("order"))
+
             if result.data:
-                return result.data
-            else:
-                # Return default FAQs if none exist in database
-                return DEFAULT_FAQS
-                
+                return response_cache.put("faqs", result.data)
+            return None
+
         except Exception:
-            # If FAQ table doesn't exist, return default FAQs
-            return DEFAULT_FAQS
-        
+            # FAQ table doesn't exist
+            return None
+
     except Exception as e:
-        logger.error(f"Get FAQs error: {e}")
-        # Return default FAQs on any error
-        return DEFAULT_FAQS
+        logger.error("Get FAQs error: %s", e)
+        return None
+
+@router.get("/")
+async def get_faqs(request: Request = None):
+    """Get all FAQs (public endpoint)"""
+    entry = response_cache.get("faqs")
+    if entry is None:
+        entry = await singleflight.run_once("faqs", _fetch_faqs)
+        if entry is None:
+            return Response(
+                content=_DEFAULT_FAQS_BYTES,
+                media_type="application/json",
+                headers=_DEFAULT_FAQS_HEADERS,
+            )
+    return response_cache.respond(request, entry)
 
 @router.post("/", response_model=FAQ)
 async def create_faq(
     request: Request,
+    background_tasks: BackgroundTasks,
     faq: FAQ,
     current_user: dict = Depends(require_admin)
 ):
@@ -79,13 +132,9 @@ async def create_faq(
     try:
         supabase = get_supabase()
         
-        faq_data = {
-            "question": faq.question,
-            "answer": faq.answer,
-            "category": faq.category,
-            "order": faq.order,
-            "active": faq.active
-        }
+        # Only the fields the client actually sent; partial updates stay
+        # partial and inserts let DB defaults fill the rest
+        faq_data = faq.model_dump(exclude_unset=True, exclude={"id"})
         
         result = supabase.table("faqs").insert(faq_data).execute()
         
@@ -95,12 +144,14 @@ async def create_faq(
                 detail="Failed to create FAQ"
             )
         
+        response_cache.invalidate("faqs")
         # Log admin action
-        await log_admin_action(
+        background_tasks.add_task(
+            log_admin_action,
             request,
             current_user["email"],
             "create_faq",
-            {"question": faq.question[:50] + "..." if len(faq.question) > 50 else faq.question}
+            {"question": _truncate(faq.question)}
         )
         
         return result.data[0]
@@ -108,7 +159,7 @@ async def create_faq(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Create FAQ error: {e}")
+        logger.error("Create FAQ error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to create FAQ"
@@ -118,6 +169,7 @@ async def create_faq(
 async def update_faq(
     faq_id: str,
     request: Request,
+    background_tasks: BackgroundTasks,
     faq: FAQ,
     current_user: dict = Depends(require_admin)
 ):
@@ -125,13 +177,9 @@ async def update_faq(
     try:
         supabase = get_supabase()
         
-        faq_data = {
-            "question": faq.question,
-            "answer": faq.answer,
-            "category": faq.category,
-            "order": faq.order,
-            "active": faq.active
-        }
+        # Only the fields the client actually sent; partial updates stay
+        # partial and inserts let DB defaults fill the rest
+        faq_data = faq.model_dump(exclude_unset=True, exclude={"id"})
         
         result = supabase.table("faqs").update(faq_data).eq("id", faq_id).execute()
         
@@ -141,12 +189,14 @@ async def update_faq(
                 detail="FAQ not found"
             )
         
+        response_cache.invalidate("faqs")
         # Log admin action
-        await log_admin_action(
+        background_tasks.add_task(
+            log_admin_action,
             request,
             current_user["email"],
             "update_faq",
-            {"faq_id": faq_id, "question": faq.question[:50] + "..." if len(faq.question) > 50 else faq.question}
+            {"faq_id": faq_id, "question": _truncate(faq.question)}
         )
         
         return result.data[0]
@@ -154,7 +204,7 @@ async def update_faq(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Update FAQ error: {e}")
+        logger.error("Update FAQ error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to update FAQ"
@@ -164,6 +214,7 @@ async def update_faq(
 async def delete_faq(
     faq_id: str,
     request: Request,
+    background_tasks: BackgroundTasks,
     current_user: dict = Depends(require_admin)
 ):
     """Delete FAQ (admin only)"""
@@ -178,8 +229,10 @@ async def delete_faq(
                 detail="FAQ not found"
             )
         
+        response_cache.invalidate("faqs")
         # Log admin action
-        await log_admin_action(
+        background_tasks.add_task(
+            log_admin_action,
             request,
             current_user["email"],
             "delete_faq",
@@ -191,8 +244,53 @@ async def delete_faq(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Delete FAQ error: {e}")
+        logger.error("Delete FAQ error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to delete FAQ"
         )
+
+@router.post("/bulk_delete")
+async def bulk_delete_faqs(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    payload: BulkDeleteRequest,
+    current_user: dict = Depends(require_admin)
+):
+    """Delete several FAQs in one statement (admin only)"""
+    if not payload.ids:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No ids provided"
+        )
+    try:
+        supabase = get_supabase()
+
+        result = await _ex(supabase.table("faqs").delete().in_("id", payload.ids))
+
+        if not result.data:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="No matching FAQs found"
+            )
+
+        response_cache.invalidate("faqs")
+        # Log admin action (one entry for the whole batch)
+        background_tasks.add_task(
+            log_admin_action,
+            request,
+            current_user["email"],
+            "bulk_delete_faqs",
+            {"count": len(result.data), "ids": payload.ids[:20]}
+        )
+
+        return {"success": True, "deleted": len(result.data)}
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Bulk delete FAQs error: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to delete FAQs"
+        )
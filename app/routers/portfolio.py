@@ -1,45 +1,97 @@
-from fastapi import APIRouter, HTTPException, Depends, Request, status
-from app.models.content import Portfolio
+from fastapi import APIRouter, HTTPException, Depends, Request, status, BackgroundTasks
+from fastapi.responses import ORJSONResponse
+from app.models.content import Portfolio, BulkDeleteRequest
 from app.core.auth0_security import require_auth0_admin as require_admin
 from app.core.security import log_admin_action
 from app.core.database import get_supabase
+from app.core import response_cache, singleflight, supabase_rest
 from typing import List
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
-router = APIRouter()
+# orjson for anything not already returned as pre-serialized bytes
+router = APIRouter(default_response_class=ORJSONResponse)
 
-@router.get("/", response_model=List[Portfolio])
-async def get_portfolio_projects():
-    """Get all portfolio projects (public endpoint) with schema tolerance"""
-    try:
-        supabase = get_supabase()
+async def _ex(query):
+    """Run a blocking supabase-py .execute() off the event loop."""
+    return await asyncio.to_thread(query.execute)
+
+def _missing_column(e: Exception) -> bool:
+    """True when the error identifies an unknown column (legacy schema)."""
+    msg = str(e)
+    return "42703" in msg or "does not exist" in msg
+
+# Prebuilt PostgREST URL for the hot list query; its shape never changes
+# at runtime, so skip supabase-py's per-call builder allocations.
+_REST_LIST_URL = supabase_rest.table_url(
+    "portfolio", "select=*&or=(is_active.eq.true,active.eq.true)&order=display_order.asc.nullslast"
+)
+
+# Set after the filtered query is first rejected (schema without the
+# boolean columns) so later misses go straight to the query that works.
+_legacy_schema = False
+
+async def _fetch_portfolio_projects():
+    """Query and cache the portfolio list; returns the cache entry.
+
+    One round trip: active filter (either column name) and ORDER BY are
+    pushed into PostgREST instead of re-sorting in Python. The prebuilt
+    URL over the shared keep-alive client is tried first; the supabase-py
+    builder remains as the fallback.
+    """
+    global _legacy_schema
+    if not _legacy_schema:
+        try:
+            resp = await supabase_rest.client.get(_REST_LIST_URL, headers=supabase_rest.HEADERS)
+            if resp.status_code == 200:
+                # Upstream body is already the JSON we serve; cache the raw
+                # bytes and skip the decode/encode round trip
+                return response_cache.put_bytes("portfolio", resp.content)
+            if resp.status_code == 400 and b"42703" in resp.content:
+                _legacy_schema = True
+        except Exception:
+            pass  # network hiccup; retry via the supabase-py client
+
+    supabase = get_supabase()
+    if not _legacy_schema:
         try:
-            result = (
+            result = await _ex(
                 supabase
                 .table("portfolio")
                 .select("*")
-                .eq("is_active", True)
-                .order("display_order")
-                .execute()
+                .or_("is_active.eq.true,active.eq.true")
+                .order("display_order", desc=False, nullsfirst=False)
             )
-        except Exception:
-            try:
-                result = (
-                    supabase
-                    .table("portfolio")
-                    .select("*")
-                    .eq("active", True)
-                    .execute()
-                )
-            except Exception:
-                result = supabase.table("portfolio").select("*").execute()
-
-        data = result.data or []
-        data.sort(key=lambda x: x.get("display_order", 0))
-        return data
+            return response_cache.put("portfolio", result.data or [])
+        except Exception as e:
+            # Only an unknown-column error proves the schema is legacy; a
+            # transient failure falls through to the (still filtered)
+            # fallback for this request without latching the process onto
+            # the legacy path until restart
+            if _missing_column(e):
+                _legacy_schema = True
+
+    # Legacy schemas predate is_active but still carry the active flag;
+    # keep filtering on it so inactive rows never reach the public cache
+    try:
+        result = await _ex(
+            supabase.table("portfolio").select("*").eq("active", True).order("display_order")
+        )
+    except Exception:
+        result = await _ex(supabase.table("portfolio").select("*").order("display_order"))
+    return response_cache.put("portfolio", result.data or [])
+
+@router.get("/")
+async def get_portfolio_projects(request: Request = None):
+    """Get all portfolio projects (public endpoint) with schema tolerance"""
+    try:
+        entry = response_cache.get("portfolio")
+        if entry is None:
+            entry = await singleflight.run_once("portfolio", _fetch_portfolio_projects)
+        return response_cache.respond(request, entry)
     except Exception as e:
-        logger.error(f"Get portfolio projects error: {e}")
+        logger.error("Get portfolio projects error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve portfolio projects"
@@ -48,6 +100,7 @@ async def get_portfolio_projects():
 @router.post("/", response_model=Portfolio)
 async def create_portfolio_project(
     request: Request,
+    background_tasks: BackgroundTasks,
     project: Portfolio,
     current_user: dict = Depends(require_admin)
 ):
@@ -55,46 +108,27 @@ async def create_portfolio_project(
     try:
         supabase = get_supabase()
 
-        project_data = {
-            "title": project.title,
-            "description": project.description,
-            "client_name": project.client_name,
-            "category": project.category,
-            "technologies": project.technologies,
-            "project_url": project.project_url,
-            "image_url": project.image_url,
-            "image_gallery": project.image_gallery,
-            "featured_image": project.featured_image,
-            "status": project.status,
-            "start_date": project.start_date,
-            "end_date": project.end_date,
-            "project_duration": project.project_duration,
-            "team_size": project.team_size,
-            "testimonial_quote": project.testimonial_quote,
-            "display_order": project.display_order,
-            "is_featured": project.is_featured,
-            "is_case_study": project.is_case_study,
-            "seo_title": project.seo_title,
-            "seo_description": project.seo_description,
-            "slug": project.slug,
-            "active": project.active
-    }
+        # Only the fields the client actually sent; partial updates stay
+        # partial and inserts let DB defaults fill the rest
+        project_data = project.model_dump(exclude_unset=True, exclude={"id"})
 
         result = supabase.table("portfolio").insert(project_data).execute()
         if not result.data:
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to create portfolio project")
-        await log_admin_action(request, current_user["email"], "create_portfolio_project", {"project_title": project.title, "category": project.category})
+        response_cache.invalidate("portfolio")
+        background_tasks.add_task(log_admin_action, request, current_user["email"], "create_portfolio_project", {"project_title": project.title, "category": project.category})
         return result.data[0]
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Create portfolio project error: {e}")
+        logger.error("Create portfolio project error: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to create portfolio project")
 
 @router.put("/{project_id}", response_model=Portfolio)
 async def update_portfolio_project(
     project_id: str,
     request: Request,
+    background_tasks: BackgroundTasks,
     project: Portfolio,
     current_user: dict = Depends(require_admin)
 ):
@@ -102,46 +136,27 @@ async def update_portfolio_project(
     try:
         supabase = get_supabase()
 
-        project_data = {
-            "title": project.title,
-            "description": project.description,
-            "client_name": project.client_name,
-            "category": project.category,
-            "technologies": project.technologies,
-            "project_url": project.project_url,
-            "image_url": project.image_url,
-            "image_gallery": project.image_gallery,
-            "featured_image": project.featured_image,
-            "status": project.status,
-            "start_date": project.start_date,
-            "end_date": project.end_date,
-            "project_duration": project.project_duration,
-            "team_size": project.team_size,
-            "testimonial_quote": project.testimonial_quote,
-            "display_order": project.display_order,
-            "is_featured": project.is_featured,
-            "is_case_study": project.is_case_study,
-            "seo_title": project.seo_title,
-            "seo_description": project.seo_description,
-            "slug": project.slug,
-            "active": project.active
-    }
+        # Only the fields the client actually sent; partial updates stay
+        # partial and inserts let DB defaults fill the rest
+        project_data = project.model_dump(exclude_unset=True, exclude={"id"})
 
         result = supabase.table("portfolio").update(project_data).eq("id", project_id).execute()
         if not result.data:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Portfolio project not found")
-        await log_admin_action(request, current_user["email"], "update_portfolio_project", {"project_id": project_id, "project_title": project.title})
+        response_cache.invalidate("portfolio")
+        background_tasks.add_task(log_admin_action, request, current_user["email"], "update_portfolio_project", {"project_id": project_id, "project_title": project.title})
         return result.data[0]
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Update portfolio project error: {e}")
+        logger.error("Update portfolio project error: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to update portfolio project")
 
 @router.delete("/{project_id}")
 async def delete_portfolio_project(
     project_id: str,
     request: Request,
+    background_tasks: BackgroundTasks,
     current_user: dict = Depends(require_admin)
 ):
     """Delete portfolio project (admin only)"""
@@ -156,8 +171,10 @@ async def delete_portfolio_project(
                 detail="Portfolio project not found"
             )
         
+        response_cache.invalidate("portfolio")
         # Log admin action
-        await log_admin_action(
+        background_tasks.add_task(
+            log_admin_action,
             request,
             current_user["email"],
             "delete_portfolio_project",
@@ -169,8 +186,53 @@ async def delete_portfolio_project(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Delete portfolio project error: {e}")
+        logger.error("Delete portfolio project error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to delete portfolio project"
         )
+
+@router.post("/bulk_delete")
+async def bulk_delete_portfolio_projects(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    payload: BulkDeleteRequest,
+    current_user: dict = Depends(require_admin)
+):
+    """Delete several portfolio projects in one statement (admin only)"""
+    if not payload.ids:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No ids provided"
+        )
+    try:
+        supabase = get_supabase()
+
+        result = await _ex(supabase.table("portfolio").delete().in_("id", payload.ids))
+
+        if not result.data:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="No matching portfolio projects found"
+            )
+
+        response_cache.invalidate("portfolio")
+        # Log admin action (one entry for the whole batch)
+        background_tasks.add_task(
+            log_admin_action,
+            request,
+            current_user["email"],
+            "bulk_delete_portfolio_projects",
+            {"count": len(result.data), "ids": payload.ids[:20]}
+        )
+
+        return {"success": True, "deleted": len(result.data)}
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Bulk delete portfolio projects error: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to delete portfolio projects"
+        )
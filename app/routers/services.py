@@ -1,52 +1,101 @@
-from fastapi import APIRouter, HTTPException, Depends, Request, status
-from app.models.content import Service
+from fastapi import APIRouter, HTTPException, Depends, Request, status, BackgroundTasks
+from fastapi.responses import ORJSONResponse
+from app.models.content import Service, BulkDeleteRequest
 from app.core.auth0_security import require_auth0_admin as require_admin
 from app.core.security import log_admin_action
 from app.core.database import get_supabase
+from app.core import response_cache, singleflight, supabase_rest
 from typing import List
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
-router = APIRouter()
+# orjson for anything not already returned as pre-serialized bytes
+router = APIRouter(default_response_class=ORJSONResponse)
 
-@router.get("/", response_model=List[Service])
-async def get_services():
-    """Get all services (public endpoint)
+async def _ex(query):
+    """Run a blocking supabase-py .execute() off the event loop."""
+    return await asyncio.to_thread(query.execute)
 
-    Tolerant to older database schemas missing generated is_active or order column.
+def _missing_column(e: Exception) -> bool:
+    """True when the error identifies an unknown column (legacy schema)."""
+    msg = str(e)
+    return "42703" in msg or "does not exist" in msg
+
+# Prebuilt PostgREST URL for the hot list query; its shape never changes
+# at runtime, so skip supabase-py's per-call builder allocations.
+_REST_LIST_URL = supabase_rest.table_url(
+    "services", "select=*&or=(is_active.eq.true,active.eq.true)&order=order.asc.nullslast"
+)
+
+# Set after the filtered query is first rejected (schema without the
+# boolean columns) so later misses go straight to the query that works.
+_legacy_schema = False
+
+async def _fetch_services():
+    """Query and cache the services list; returns the cache entry.
+
+    One round trip: active filter (either column name) and ORDER BY are
+    pushed into PostgREST instead of re-sorting in Python. The prebuilt
+    URL over the shared keep-alive client is tried first; the supabase-py
+    builder remains as the fallback.
     """
-    try:
-        supabase = get_supabase()
-        # Preferred query path
+    global _legacy_schema
+    if not _legacy_schema:
+        try:
+            resp = await supabase_rest.client.get(_REST_LIST_URL, headers=supabase_rest.HEADERS)
+            if resp.status_code == 200:
+                # Upstream body is already the JSON we serve; cache the raw
+                # bytes and skip the decode/encode round trip
+                return response_cache.put_bytes("services", resp.content)
+            if resp.status_code == 400 and b"42703" in resp.content:
+                _legacy_schema = True
+        except Exception:
+            pass  # network hiccup; retry via the supabase-py client
+
+    supabase = get_supabase()
+    if not _legacy_schema:
         try:
-            result = (
+            result = await _ex(
                 supabase
                 .table("services")
                 .select("*")
-                .eq("is_active", True)
-                .order("order")
-                .execute()
+                .or_("is_active.eq.true,active.eq.true")
+                .order("order", desc=False, nullsfirst=False)
             )
-        except Exception:
-            # Retry without is_active/order assumptions
-            try:
-                result = (
-                    supabase
-                    .table("services")
-                    .select("*")
-                    .eq("active", True)
-                    .execute()
-                )
-            except Exception:
-                result = supabase.table("services").select("*").execute()
-
-        data = result.data or []
-        # Python-side stable sort if order key present
-        data.sort(key=lambda x: x.get("order", 0))
-        return data
+            return response_cache.put("services", result.data or [])
+        except Exception as e:
+            # Only an unknown-column error proves the schema is legacy; a
+            # transient failure falls through to the (still filtered)
+            # fallback for this request without latching the process onto
+            # the legacy path until restart
+            if _missing_column(e):
+                _legacy_schema = True
+
+    # Legacy schemas predate is_active but still carry the active flag;
+    # keep filtering on it so inactive rows never reach the public cache
+    try:
+        result = await _ex(
+            supabase.table("services").select("*").eq("active", True).order("order")
+        )
+    except Exception:
+        result = await _ex(supabase.table("services").select("*").order("order"))
+    return response_cache.put("services", result.data or [])
+
+@router.get("/")
+async def get_services(request: Request = None):
+    """Get all services (public endpoint)
+
+    Tolerant to older database schemas missing generated is_active or order column.
+    """
+    try:
+        entry = response_cache.get("services")
+        if entry is None:
+            entry = await singleflight.run_once("services", _fetch_services)
+        return response_cache.respond(request, entry)
 
     except Exception as e:
-        logger.error(f"Get services error: {e}")
+        logger.error("Get services error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve services"
@@ -55,6 +104,7 @@ async def get_services():
 @router.post("/", response_model=Service)
 async def create_service(
     request: Request,
+    background_tasks: BackgroundTasks,
     service: Service,
     current_user: dict = Depends(require_admin)
 ):
@@ -62,15 +112,9 @@ async def create_service(
     try:
         supabase = get_supabase()
         
-        service_data = {
-            "title": service.title,
-            "description": service.description,
-            "icon": service.icon,
-            "features": service.features,
-            "price": service.price,
-            "order": service.order,
-            "active": service.active
-        }
+        # Only the fields the client actually sent; partial updates stay
+        # partial and inserts let DB defaults fill the rest
+        service_data = service.model_dump(exclude_unset=True, exclude={"id"})
         
         result = supabase.table("services").insert(service_data).execute()
         
@@ -80,8 +124,10 @@ async def create_service(
                 detail="Failed to create service"
             )
         
+        response_cache.invalidate("services")
         # Log admin action
-        await log_admin_action(
+        background_tasks.add_task(
+            log_admin_action,
             request,
             current_user["email"],
             "create_service",
@@ -93,7 +139,7 @@ async def create_service(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Create service error: {e}")
+        logger.error("Create service error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to create service"
@@ -103,6 +149,7 @@ async def create_service(
 async def update_service(
     service_id: str,
     request: Request,
+    background_tasks: BackgroundTasks,
     service: Service,
     current_user: dict = Depends(require_admin)
 ):
@@ -110,15 +157,9 @@ async def update_service(
     try:
         supabase = get_supabase()
         
-        service_data = {
-            "title": service.title,
-            "description": service.description,
-            "icon": service.icon,
-            "features": service.features,
-            "price": service.price,
-            "order": service.order,
-            "active": service.active
-        }
+        # Only the fields the client actually sent; partial updates stay
+        # partial and inserts let DB defaults fill the rest
+        service_data = service.model_dump(exclude_unset=True, exclude={"id"})
         
         result = supabase.table("services").update(service_data).eq("id", service_id).execute()
         
@@ -128,8 +169,10 @@ async def update_service(
                 detail="Service not found"
             )
         
+        response_cache.invalidate("services")
         # Log admin action
-        await log_admin_action(
+        background_tasks.add_task(
+            log_admin_action,
             request,
             current_user["email"],
             "update_service",
@@ -141,7 +184,7 @@ async def update_service(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Update service error: {e}")
+        logger.error("Update service error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to update service"
@@ -151,6 +194,7 @@ async def update_service(
 async def delete_service(
     service_id: str,
     request: Request,
+    background_tasks: BackgroundTasks,
     current_user: dict = Depends(require_admin)
 ):
     """Delete service (admin only)"""
@@ -165,8 +209,10 @@ async def delete_service(
                 detail="Service not found"
             )
         
+        response_cache.invalidate("services")
         # Log admin action
-        await log_admin_action(
+        background_tasks.add_task(
+            log_admin_action,
             request,
             current_user["email"],
             "delete_service",
@@ -178,8 +224,53 @@ async def delete_service(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Delete service error: {e}")
+        logger.error("Delete service error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to delete service"
         )
+
+@router.post("/bulk_delete")
+async def bulk_delete_services(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    payload: BulkDeleteRequest,
+    current_user: dict = Depends(require_admin)
+):
+    """Delete several services in one statement (admin only)"""
+    if not payload.ids:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No ids provided"
+        )
+    try:
+        supabase = get_supabase()
+
+        result = await _ex(supabase.table("services").delete().in_("id", payload.ids))
+
+        if not result.data:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="No matching services found"
+            )
+
+        response_cache.invalidate("services")
+        # Log admin action (one entry for the whole batch)
+        background_tasks.add_task(
+            log_admin_action,
+            request,
+            current_user["email"],
+            "bulk_delete_services",
+            {"count": len(result.data), "ids": payload.ids[:20]}
+        )
+
+        return {"success": True, "deleted": len(result.data)}
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Bulk delete services error: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to delete services"
+        )
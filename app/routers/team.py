@@ -1,37 +1,98 @@
-from fastapi import APIRouter, HTTPException, Depends, Request, status
-from app.models.content import TeamMember
+from fastapi import APIRouter, HTTPException, Depends, Request, status, BackgroundTasks
+from fastapi.responses import ORJSONResponse
+from app.models.content import TeamMember, BulkDeleteRequest
 from app.core.auth0_security import require_auth0_admin as require_admin
 from app.core.security import log_admin_action
 from app.core.database import get_supabase
+from app.core import response_cache, singleflight, supabase_rest
 from typing import List
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
-router = APIRouter()
+# orjson for anything not already returned as pre-serialized bytes
+router = APIRouter(default_response_class=ORJSONResponse)
 
-@router.get("/", response_model=List[TeamMember])
-async def get_team_members():
-    """Get all team members (public endpoint) with schema tolerance"""
-    try:
-        supabase = get_supabase()
+async def _ex(query):
+    """Run a blocking supabase-py .execute() off the event loop."""
+    return await asyncio.to_thread(query.execute)
+
+def _missing_column(e: Exception) -> bool:
+    """True when the error identifies an unknown column (legacy schema)."""
+    msg = str(e)
+    return "42703" in msg or "does not exist" in msg
+
+# Prebuilt PostgREST URL for the hot list query; its shape never changes
+# at runtime, so skip supabase-py's per-call builder allocations.
+_REST_LIST_URL = supabase_rest.table_url(
+    "team_members", "select=*&or=(is_active.eq.true,active.eq.true)&order=order.asc.nullslast"
+)
+
+# Set after the filtered query is first rejected (schema without the
+# boolean columns) so later misses go straight to the query that works.
+_legacy_schema = False
+
+async def _fetch_team_members():
+    """Query and cache the team list; returns the cache entry.
+
+    One round trip: active filter (either column name) and ORDER BY are
+    pushed into PostgREST instead of re-sorting in Python. The prebuilt
+    URL over the shared keep-alive client is tried first; the supabase-py
+    builder remains as the fallback.
+    """
+    global _legacy_schema
+    if not _legacy_schema:
+        try:
+            resp = await supabase_rest.client.get(_REST_LIST_URL, headers=supabase_rest.HEADERS)
+            if resp.status_code == 200:
+                # Upstream body is already the JSON we serve; cache the raw
+                # bytes and skip the decode/encode round trip
+                return response_cache.put_bytes("team_members", resp.content)
+            if resp.status_code == 400 and b"42703" in resp.content:
+                _legacy_schema = True
+        except Exception:
+            pass  # network hiccup; retry via the supabase-py client
+
+    supabase = get_supabase()
+    if not _legacy_schema:
         try:
-            result = (
+            result = await _ex(
                 supabase
                 .table("team_members")
                 .select("*")
-                .eq("active", True)
-                .order("order")
-                .execute()
+                .or_("is_active.eq.true,active.eq.true")
+                .order("order", desc=False, nullsfirst=False)
             )
-        except Exception:
-            result = supabase.table("team_members").select("*").execute()
+            return response_cache.put("team_members", result.data or [])
+        except Exception as e:
+            # Only an unknown-column error proves the schema is legacy; a
+            # transient failure falls through to the (still filtered)
+            # fallback for this request without latching the process onto
+            # the legacy path until restart
+            if _missing_column(e):
+                _legacy_schema = True
+
+    # Legacy schemas predate is_active but still carry the active flag;
+    # keep filtering on it so inactive rows never reach the public cache
+    try:
+        result = await _ex(
+            supabase.table("team_members").select("*").eq("active", True).order("order")
+        )
+    except Exception:
+        result = await _ex(supabase.table("team_members").select("*").order("order"))
+    return response_cache.put("team_members", result.data or [])
 
-        data = result.data or []
-        data.sort(key=lambda x: x.get("order", 0))
-        return data
+@router.get("/")
+async def get_team_members(request: Request = None):
+    """Get all team members (public endpoint) with schema tolerance"""
+    try:
+        entry = response_cache.get("team_members")
+        if entry is None:
+            entry = await singleflight.run_once("team_members", _fetch_team_members)
+        return response_cache.respond(request, entry)
 
     except Exception as e:
-        logger.error(f"Get team members error: {e}")
+        logger.error("Get team members error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve team members"
@@ -40,6 +101,7 @@ async def get_team_members():
 @router.post("/", response_model=TeamMember)
 async def create_team_member(
     request: Request,
+    background_tasks: BackgroundTasks,
     member: TeamMember,
     current_user: dict = Depends(require_admin)
 ):
@@ -47,15 +109,9 @@ async def create_team_member(
     try:
         supabase = get_supabase()
         
-        member_data = {
-            "name": member.name,
-            "position": member.position,
-            "bio": member.bio,
-            "image": member.image,
-            "social_links": member.social_links,
-            "order": member.order,
-            "active": member.active
-        }
+        # Only the fields the client actually sent; partial updates stay
+        # partial and inserts let DB defaults fill the rest
+        member_data = member.model_dump(exclude_unset=True, exclude={"id"})
         
         result = supabase.table("team_members").insert(member_data).execute()
         
@@ -65,8 +121,10 @@ async def create_team_member(
                 detail="Failed to create team member"
             )
         
+        response_cache.invalidate("team_members")
         # Log admin action
-        await log_admin_action(
+        background_tasks.add_task(
+            log_admin_action,
             request,
             current_user["email"],
             "create_team_member",
@@ -78,7 +136,7 @@ async def create_team_member(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Create team member error: {e}")
+        logger.error("Create team member error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to create team member"
@@ -88,6 +146,7 @@ async def create_team_member(
 async def update_team_member(
     member_id: str,
     request: Request,
+    background_tasks: BackgroundTasks,
     member: TeamMember,
     current_user: dict = Depends(require_admin)
 ):
@@ -95,15 +154,9 @@ async def update_team_member(
     try:
         supabase = get_supabase()
         
-        member_data = {
-            "name": member.name,
-            "position": member.position,
-            "bio": member.bio,
-            "image": member.image,
-            "social_links": member.social_links,
-            "order": member.order,
-            "active": member.active
-        }
+        # Only the fields the client actually sent; partial updates stay
+        # partial and inserts let DB defaults fill the rest
+        member_data = member.model_dump(exclude_unset=True, exclude={"id"})
         
         result = supabase.table("team_members").update(member_data).eq("id", member_id).execute()
         
@@ -113,8 +166,10 @@ async def update_team_member(
                 detail="Team member not found"
             )
         
+        response_cache.invalidate("team_members")
         # Log admin action
-        await log_admin_action(
+        background_tasks.add_task(
+            log_admin_action,
             request,
             current_user["email"],
             "update_team_member",
@@ -126,7 +181,7 @@ async def update_team_member(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Update team member error: {e}")
+        logger.error("Update team member error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to update team member"
@@ -136,6 +191,7 @@ async def update_team_member(
 async def delete_team_member(
     member_id: str,
     request: Request,
+    background_tasks: BackgroundTasks,
     current_user: dict = Depends(require_admin)
 ):
     """Delete team member (admin only)"""
@@ -150,8 +206,10 @@ async def delete_team_member(
                 detail="Team member not found"
             )
         
+        response_cache.invalidate("team_members")
         # Log admin action
-        await log_admin_action(
+        background_tasks.add_task(
+            log_admin_action,
             request,
             current_user["email"],
             "delete_team_member",
@@ -163,8 +221,53 @@ async def delete_team_member(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Delete team member error: {e}")
+        logger.error("Delete team member error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to delete team member"
         )
+
+@router.post("/bulk_delete")
+async def bulk_delete_team_members(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    payload: BulkDeleteRequest,
+    current_user: dict = Depends(require_admin)
+):
+    """Delete several team members in one statement (admin only)"""
+    if not payload.ids:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No ids provided"
+        )
+    try:
+        supabase = get_supabase()
+
+        result = await _ex(supabase.table("team_members").delete().in_("id", payload.ids))
+
+        if not result.data:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="No matching team members found"
+            )
+
+        response_cache.invalidate("team_members")
+        # Log admin action (one entry for the whole batch)
+        background_tasks.add_task(
+            log_admin_action,
+            request,
+            current_user["email"],
+            "bulk_delete_team_members",
+            {"count": len(result.data), "ids": payload.ids[:20]}
+        )
+
+        return {"success": True, "deleted": len(result.data)}
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Bulk delete team members error: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to delete team members"
+        )
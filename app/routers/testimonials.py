@@ -1,45 +1,97 @@
-from fastapi import APIRouter, HTTPException, Depends, Request, status
-from app.models.content import Testimonial
+from fastapi import APIRouter, HTTPException, Depends, Request, status, BackgroundTasks
+from fastapi.responses import ORJSONResponse
+from app.models.content import Testimonial, BulkDeleteRequest
 from app.core.auth0_security import require_auth0_admin as require_admin
 from app.core.security import log_admin_action
 from app.core.database import get_supabase
+from app.core import response_cache, singleflight, supabase_rest
 from typing import List
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
-router = APIRouter()
+# orjson for anything not already returned as pre-serialized bytes
+router = APIRouter(default_response_class=ORJSONResponse)
 
-@router.get("/", response_model=List[Testimonial])
-async def get_testimonials():
-    """Get all testimonials (public endpoint) with graceful fallbacks"""
-    try:
-        supabase = get_supabase()
+async def _ex(query):
+    """Run a blocking supabase-py .execute() off the event loop."""
+    return await asyncio.to_thread(query.execute)
+
+def _missing_column(e: Exception) -> bool:
+    """True when the error identifies an unknown column (legacy schema)."""
+    msg = str(e)
+    return "42703" in msg or "does not exist" in msg
+
+# Prebuilt PostgREST URL for the hot list query; its shape never changes
+# at runtime, so skip supabase-py's per-call builder allocations.
+_REST_LIST_URL = supabase_rest.table_url(
+    "testimonials", "select=*&or=(is_active.eq.true,active.eq.true)&order=order.asc.nullslast"
+)
+
+# Set after the filtered query is first rejected (schema without the
+# boolean columns) so later misses go straight to the query that works.
+_legacy_schema = False
+
+async def _fetch_testimonials():
+    """Query and cache the testimonials list; returns the cache entry.
+
+    One round trip: active filter (either column name) and ORDER BY are
+    pushed into PostgREST instead of re-sorting in Python. The prebuilt
+    URL over the shared keep-alive client is tried first; the supabase-py
+    builder remains as the fallback.
+    """
+    global _legacy_schema
+    if not _legacy_schema:
+        try:
+            resp = await supabase_rest.client.get(_REST_LIST_URL, headers=supabase_rest.HEADERS)
+            if resp.status_code == 200:
+                # Upstream body is already the JSON we serve; cache the raw
+                # bytes and skip the decode/encode round trip
+                return response_cache.put_bytes("testimonials", resp.content)
+            if resp.status_code == 400 and b"42703" in resp.content:
+                _legacy_schema = True
+        except Exception:
+            pass  # network hiccup; retry via the supabase-py client
+
+    supabase = get_supabase()
+    if not _legacy_schema:
         try:
-            result = (
+            result = await _ex(
                 supabase
                 .table("testimonials")
                 .select("*")
-                .eq("is_active", True)
-                .order("order")
-                .execute()
+                .or_("is_active.eq.true,active.eq.true")
+                .order("order", desc=False, nullsfirst=False)
             )
-        except Exception:
-            try:
-                result = (
-                    supabase
-                    .table("testimonials")
-                    .select("*")
-                    .eq("active", True)
-                    .execute()
-                )
-            except Exception:
-                result = supabase.table("testimonials").select("*").execute()
-
-        data = result.data or []
-        data.sort(key=lambda x: x.get("order", 0))
-        return data
+            return response_cache.put("testimonials", result.data or [])
+        except Exception as e:
+            # Only an unknown-column error proves the schema is legacy; a
+            # transient failure falls through to the (still filtered)
+            # fallback for this request without latching the process onto
+            # the legacy path until restart
+            if _missing_column(e):
+                _legacy_schema = True
+
+    # Legacy schemas predate is_active but still carry the active flag;
+    # keep filtering on it so inactive rows never reach the public cache
+    try:
+        result = await _ex(
+            supabase.table("testimonials").select("*").eq("active", True).order("order")
+        )
+    except Exception:
+        result = await _ex(supabase.table("testimonials").select("*").order("order"))
+    return response_cache.put("testimonials", result.data or [])
+
+@router.get("/")
+async def get_testimonials(request: Request = None):
+    """Get all testimonials (public endpoint) with graceful fallbacks"""
+    try:
+        entry = response_cache.get("testimonials")
+        if entry is None:
+            entry = await singleflight.run_once("testimonials", _fetch_testimonials)
+        return response_cache.respond(request, entry)
     except Exception as e:
-        logger.error(f"Get testimonials error: {e}")
+        logger.error("Get testimonials error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve testimonials"
@@ -48,6 +100,7 @@ async def get_testimonials():
 @router.post("/", response_model=Testimonial)
 async def create_testimonial(
     request: Request,
+    background_tasks: BackgroundTasks,
     testimonial: Testimonial,
     current_user: dict = Depends(require_admin)
 ):
@@ -55,17 +108,9 @@ async def create_testimonial(
     try:
         supabase = get_supabase()
         
-        testimonial_data = {
-            "name": testimonial.name,
-            "company": testimonial.company,
-            "position": testimonial.position,
-            "content": testimonial.content,
-            "rating": testimonial.rating,
-            "image": testimonial.image,
-            "featured": testimonial.featured,
-            "order": testimonial.order,
-            "active": testimonial.active
-        }
+        # Only the fields the client actually sent; partial updates stay
+        # partial and inserts let DB defaults fill the rest
+        testimonial_data = testimonial.model_dump(exclude_unset=True, exclude={"id"})
         
         result = supabase.table("testimonials").insert(testimonial_data).execute()
         
@@ -75,8 +120,10 @@ async def create_testimonial(
                 detail="Failed to create testimonial"
             )
         
+        response_cache.invalidate("testimonials")
         # Log admin action
-        await log_admin_action(
+        background_tasks.add_task(
+            log_admin_action,
             request,
             current_user["email"],
             "create_testimonial",
@@ -88,7 +135,7 @@ async def create_testimonial(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Create testimonial error: {e}")
+        logger.error("Create testimonial error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to create testimonial"
@@ -98,6 +145,7 @@ async def create_testimonial(
 async def update_testimonial(
     testimonial_id: str,
     request: Request,
+    background_tasks: BackgroundTasks,
     testimonial: Testimonial,
     current_user: dict = Depends(require_admin)
 ):
@@ -105,17 +153,9 @@ async def update_testimonial(
     try:
         supabase = get_supabase()
         
-        testimonial_data = {
-            "name": testimonial.name,
-            "company": testimonial.company,
-            "position": testimonial.position,
-            "content": testimonial.content,
-            "rating": testimonial.rating,
-            "image": testimonial.image,
-            "featured": testimonial.featured,
-            "order": testimonial.order,
-            "active": testimonial.active
-        }
+        # Only the fields the client actually sent; partial updates stay
+        # partial and inserts let DB defaults fill the rest
+        testimonial_data = testimonial.model_dump(exclude_unset=True, exclude={"id"})
         
         result = supabase.table("testimonials").update(testimonial_data).eq("id", testimonial_id).execute()
         
@@ -125,8 +165,10 @@ async def update_testimonial(
                 detail="Testimonial not found"
             )
         
+        response_cache.invalidate("testimonials")
         # Log admin action
-        await log_admin_action(
+        background_tasks.add_task(
+            log_admin_action,
             request,
             current_user["email"],
             "update_testimonial",
@@ -138,7 +180,7 @@ async def update_testimonial(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Update testimonial error: {e}")
+        logger.error("Update testimonial error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to update testimonial"
@@ -148,6 +190,7 @@ async def update_testimonial(
 async def delete_testimonial(
     testimonial_id: str,
     request: Request,
+    background_tasks: BackgroundTasks,
     current_user: dict = Depends(require_admin)
 ):
     """Delete testimonial (admin only)"""
@@ -162,8 +205,10 @@ async def delete_testimonial(
                 detail="Testimonial not found"
             )
         
+        response_cache.invalidate("testimonials")
         # Log admin action
-        await log_admin_action(
+        background_tasks.add_task(
+            log_admin_action,
             request,
             current_user["email"],
             "delete_testimonial",
@@ -175,8 +220,53 @@ async def delete_testimonial(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Delete testimonial error: {e}")
+        logger.error("Delete testimonial error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to delete testimonial"
         )
+
+@router.post("/bulk_delete")
+async def bulk_delete_testimonials(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    payload: BulkDeleteRequest,
+    current_user: dict = Depends(require_admin)
+):
+    """Delete several testimonials in one statement (admin only)"""
+    if not payload.ids:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No ids provided"
+        )
+    try:
+        supabase = get_supabase()
+
+        result = await _ex(supabase.table("testimonials").delete().in_("id", payload.ids))
+
+        if not result.data:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="No matching testimonials found"
+            )
+
+        response_cache.invalidate("testimonials")
+        # Log admin action (one entry for the whole batch)
+        background_tasks.add_task(
+            log_admin_action,
+            request,
+            current_user["email"],
+            "bulk_delete_testimonials",
+            {"count": len(result.data), "ids": payload.ids[:20]}
+        )
+
+        return {"success": True, "deleted": len(result.data)}
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Bulk delete testimonials error: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to delete testimonials"
+        )
@@ -1,3 +1,6 @@
+import asyncio
+import random
+
 import httpx
 from typing import List, Optional
 from app.core.config import settings
@@ -6,44 +9,79 @@ import logging
 logger = logging.getLogger(__name__)
 
 RESEND_BASE = "https://api.resend.com"
+_RESEND_URL = f"{RESEND_BASE}/emails"
+
+# Default recipient list parsed once; NOTIFY_RECIPIENTS may be a
+# comma-separated string.
+_DEFAULT_RECIPIENTS = (
+    [s.strip() for s in settings.NOTIFY_RECIPIENTS.split(',') if s.strip()]
+    if isinstance(settings.NOTIFY_RECIPIENTS, str)
+    else list(settings.NOTIFY_RECIPIENTS)
+)
+
+# Lazily-created shared client: keeps the TLS connection to Resend warm
+# instead of paying a fresh handshake per email. Auth headers ride on the
+# client, so each send passes only the payload.
+_client: Optional[httpx.AsyncClient] = None
+
+def get_client() -> httpx.AsyncClient:
+    """Return the shared Resend client, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            timeout=10,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            headers={
+                "Authorization": f"Bearer {settings.RESEND_API_KEY}",
+                "Content-Type": "application/json",
+            },
+        )
+    return _client
+
+async def close_email_client() -> None:
+    """Close the shared client; call from the lifespan shutdown."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
 
 async def send_resend_email(subject: str, html: str, to: Optional[List[str]] = None, from_email: Optional[str] = None) -> bool:
     """Send an email via Resend API.
     Returns True on success, False on failure.
     """
-    api_key = settings.RESEND_API_KEY
-    if not api_key:
+    if not settings.RESEND_API_KEY:
         logger.warning("RESEND_API_KEY not set; skipping email send")
         return False
 
-    if to is not None:
-        recipients = to
-    else:
-        # settings.NOTIFY_RECIPIENTS may be a comma-separated string
-        if isinstance(settings.NOTIFY_RECIPIENTS, str):
-            recipients = [s.strip() for s in settings.NOTIFY_RECIPIENTS.split(',') if s.strip()]
-        else:
-            recipients = list(settings.NOTIFY_RECIPIENTS)
     payload = {
         "from": from_email or settings.EMAIL_FROM,
-        "to": recipients,
+        "to": to if to is not None else _DEFAULT_RECIPIENTS,
         "subject": subject,
         "html": html,
     }
 
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json",
-    }
-
     try:
-        async with httpx.AsyncClient(timeout=10) as client:
-            resp = await client.post(f"{RESEND_BASE}/emails", json=payload, headers=headers)
+        # Retry transient upstream failures (rate limits, gateway errors)
+        # with exponential backoff + full jitter; anything else fails fast.
+        for attempt in range(4):
+            resp = await get_client().post(_RESEND_URL, json=payload)
             if resp.status_code in (200, 202):
                 logger.info("Resend email queued: %s", resp.text)
                 return True
-            logger.error("Resend send failed [%s]: %s", resp.status_code, resp.text)
-            return False
+            if resp.status_code in (429, 502, 503, 504) and attempt < 3:
+                delay = random.uniform(0, min(30.0, 0.5 * (2 ** attempt)))
+                retry_after = resp.headers.get("Retry-After")
+                if retry_after:
+                    try:
+                        delay = max(delay, float(retry_after))
+                    except ValueError:
+                        pass
+                logger.warning("Resend returned %s; retrying in %.1fs", resp.status_code, delay)
+                await asyncio.sleep(delay)
+                continue
+            break
+        logger.error("Resend send failed [%s]: %s", resp.status_code, resp.text)
+        return False
     except Exception as e:
         logger.exception("Resend send exception: %s", e)
         return False
@@ -3,12 +3,13 @@
 
 import sys
 import os
+import argparse
 import asyncio
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from app.core.database import get_supabase, init_db
 
-async def cleanup_team_table():
+async def cleanup_team_table(assume_yes: bool = False, dry_run: bool = False):
     """Clean up 'team' table after successful migration to 'team_members'"""
     await init_db()
     supabase = get_supabase()
@@ -16,56 +17,77 @@ async def cleanup_team_table():
     print("🧹 Cleaning up 'team' table")
     print("=" * 50)
     
-    # Verify team_members has data before cleanup
+    # Verify team_members has data before cleanup (HEAD count: no row
+    # payload transferred just to check the table isn't empty)
     print("\n🔍 Verifying 'team_members' table has data...")
     try:
-        result = supabase.table("team_members").select("*").execute()
-        team_members_data = result.data or []
-        print(f"   Found {len(team_members_data)} records in 'team_members' table")
-        
-        if len(team_members_data) == 0:
+        result = supabase.table("team_members").select("id", count="exact", head=True).execute()
+        team_members_count = result.count or 0
+        print(f"   Found {team_members_count} records in 'team_members' table")
+
+        if team_members_count == 0:
             print("   ❌ No data in 'team_members' table - aborting cleanup!")
             return
-        
-        # Show what will be deleted
+
+        # Show what will be deleted; only the columns the report needs.
+        # Read in explicit pages: PostgREST caps a single select at ~1000
+        # rows, which would silently truncate the delete set on big tables.
         print(f"\n📋 Checking 'team' table for cleanup...")
-        result = supabase.table("team").select("*").execute()
-        team_data = result.data or []
+        team_data = []
+        page_size = 1000
+        offset = 0
+        while True:
+            result = supabase.table("team").select("id,name").range(offset, offset + page_size - 1).execute()
+            rows = result.data or []
+            team_data.extend(rows)
+            if len(rows) < page_size:
+                break
+            offset += len(rows)
         print(f"   Found {len(team_data)} records in 'team' table to clean up")
         
         if len(team_data) == 0:
             print("   ✅ 'team' table is already clean")
             return
         
-        # List items to be deleted
-        for item in team_data:
+        # List items to be deleted; cap the per-row output so large tables
+        # don't serialize the run on thousands of stdout flushes
+        for item in team_data[:20]:
             print(f"   - Will delete: {item.get('name', 'Unknown')} (ID: {item.get('id')})")
-        
-        # Confirm before deletion
-        response = input(f"\n❓ Delete {len(team_data)} records from 'team' table? (y/N): ")
-        if response.lower() != 'y':
-            print("   🚫 Cleanup cancelled")
+        if len(team_data) > 20:
+            print(f"   ... and {len(team_data) - 20} more")
+
+        if dry_run:
+            print(f"\n🔎 Dry run - would delete {len(team_data)} records, nothing changed")
             return
+
+        # Confirm before deletion unless running non-interactively (--yes)
+        if not assume_yes:
+            response = input(f"\n❓ Delete {len(team_data)} records from 'team' table? (y/N): ")
+            if response.lower() != 'y':
+                print("   🚫 Cleanup cancelled")
+                return
         
-        # Delete all records
+        # Delete all records in bulk (one round trip per chunk instead of
+        # one per row); chunk the ids to stay under PostgREST URL limits
         print(f"\n🗑️ Deleting records from 'team' table...")
-        for item in team_data:
+        ids = [item["id"] for item in team_data]
+        deleted = 0
+        for start in range(0, len(ids), 1000):
+            chunk = ids[start:start + 1000]
             try:
-                delete_result = supabase.table("team").delete().eq("id", item["id"]).execute()
-                if delete_result.data:
-                    print(f"   ✅ Deleted: {item.get('name', 'Unknown')}")
-                else:
-                    print(f"   ❌ Failed to delete: {item.get('name', 'Unknown')}")
+                delete_result = supabase.table("team").delete().in_("id", chunk).execute()
+                deleted += len(delete_result.data or [])
             except Exception as e:
-                print(f"   ❌ Error deleting {item.get('name', 'Unknown')}: {e}")
+                print(f"   ❌ Error deleting batch starting at {start}: {e}")
+        print(f"   ✅ Deleted {deleted} of {len(ids)} records")
         
-        # Verify cleanup
+        # Verify cleanup (count only; no need to download survivors)
         print(f"\n🔍 Verifying cleanup...")
-        result = supabase.table("team").select("*").execute()
-        remaining_data = result.data or []
-        print(f"   Remaining records in 'team' table: {len(remaining_data)}")
-        
-        if len(remaining_data) == 0:
+        result = supabase.table("team").select("id", count="exact", head=True).execute()
+        remaining = result.count or 0
+        print(f"   Remaining records in 'team' table: {remaining}")
+
+        if remaining == 0:
             print("   ✅ Cleanup successful! 'team' table is now empty")
         else:
             print("   ⚠️ Some records remain - check for errors above")
@@ -74,4 +96,8 @@ async def cleanup_team_table():
         print(f"   ❌ Error during cleanup: {e}")
 
 if __name__ == "__main__":
-    asyncio.run(cleanup_team_table())
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Remove migrated rows from the 'team' table")
+    parser.add_argument("--yes", action="store_true", help="skip the confirmation prompt (for cron/CI)")
+    parser.add_argument("--dry-run", action="store_true", help="list what would be deleted and exit")
+    args = parser.parse_args()
+    asyncio.run(cleanup_team_table(assume_yes=args.yes, dry_run=args.dry_run))
\ No newline at end of file
@@ -0,0 +1,32 @@
+-- Partial indexes backing the public list endpoints.
+--
+-- Every public GET filters on the active flag and orders by the display
+-- column, so give each table a partial index on that column restricted to
+-- active rows. The planner turns the list queries into index range scans
+-- instead of sequential scans, and the partial predicate keeps the index
+-- small on tables with many inactive rows.
+--
+-- Run against the Supabase project database (SQL editor or psql). CREATE
+-- INDEX CONCURRENTLY cannot run inside a transaction block; execute each
+-- statement on its own. Tables still on the legacy "active" column should
+-- swap the predicate accordingly.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS faqs_active_order_idx
+    ON faqs ("order") WHERE is_active;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS services_active_order_idx
+    ON services ("order") WHERE is_active;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS team_members_active_order_idx
+    ON team_members ("order") WHERE is_active;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS testimonials_active_order_idx
+    ON testimonials ("order") WHERE is_active;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS portfolio_active_order_idx
+    ON portfolio (display_order) WHERE is_active;
+
+-- Contacts admin view sorts newest-first; keyset pagination on created_at
+-- benefits from a matching descending index.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS contacts_created_at_idx
+    ON contacts (created_at DESC);
@@ -0,0 +1,25 @@
+-- Single-round-trip dashboard counts for the admin stats endpoint.
+--
+-- app/routers/admin.py calls this via supabase.rpc("get_dashboard_counts")
+-- and expects the same JSON shape _collect_dashboard_stats builds from six
+-- separate HEAD count queries; this function produces it in one SQL call.
+--
+-- Run against the Supabase project database (SQL editor or psql).
+-- SECURITY DEFINER so the anon/service role used by the backend can count
+-- across the content tables without per-table grants.
+
+CREATE OR REPLACE FUNCTION get_dashboard_counts()
+RETURNS json
+LANGUAGE sql
+STABLE
+SECURITY DEFINER
+AS $$
+    SELECT json_build_object(
+        'total_messages',           (SELECT count(*) FROM contacts),
+        'unread_messages',          (SELECT count(*) FROM contacts WHERE status = 'unread'),
+        'total_services',           (SELECT count(*) FROM services),
+        'total_team_members',       (SELECT count(*) FROM team_members),
+        'total_portfolio_projects', (SELECT count(*) FROM portfolio),
+        'total_testimonials',       (SELECT count(*) FROM testimonials)
+    );
+$$;
@@ -0,0 +1,13 @@
+-- Keyset-pagination index for the admin audit log.
+--
+-- app/routers/admin.py pages admin_audit_logs by (timestamp DESC, id DESC)
+-- with an (before_ts, before_id) cursor; this index matches that sort order
+-- exactly, so each page is an index range seek from the cursor instead of a
+-- sort over the whole table.
+--
+-- Run against the Supabase project database (SQL editor or psql). CREATE
+-- INDEX CONCURRENTLY cannot run inside a transaction block; execute the
+-- statement on its own.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS admin_audit_ts_idx
+    ON admin_audit_logs ("timestamp" DESC, id DESC);
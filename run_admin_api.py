@@ -1,29 +1,37 @@
 """Unified Admin API launcher.
 
-Ensures project root and backend added to sys.path, applies monkeypatches
+Applies monkeypatches
 early, then runs uvicorn for main_admin:app.
 """
 from __future__ import annotations
-import os, sys, pathlib, uvicorn
+import os, pathlib, types, uvicorn
 
 ROOT = pathlib.Path(__file__).resolve().parents[1]
 BACKEND = ROOT / 'backend'
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
-if str(BACKEND) not in sys.path:
-    sys.path.insert(0, str(BACKEND))
 
-# Apply patches if any
+# Apply patches if any (the app package is importable via the editable
+# install; no sys.path gymnastics needed)
 from app.core import monkeypatches  # noqa: F401
 
+# Environment resolved once at import (see run_backend.py)
+CFG = types.SimpleNamespace(
+    host=os.environ.get('ADMIN_API_HOST', '0.0.0.0'),
+    port=int(os.environ.get('ADMIN_API_PORT', '8001')),
+    reload=os.environ.get('ENVIRONMENT', 'development') == 'development',
+)
+
 def main():
-    os.chdir(BACKEND)
     uvicorn.run(
         'main_admin:app',
-        host=os.environ.get('ADMIN_API_HOST', '0.0.0.0'),
-        port=int(os.environ.get('ADMIN_API_PORT', '8001')),
-        reload=os.environ.get('ENVIRONMENT', 'development') == 'development',
+        host=CFG.host,
+        port=CFG.port,
+        reload=CFG.reload,
+        # See run_backend.py: import path via app_dir, watch set narrowed
+        app_dir=str(BACKEND),
+        reload_dirs=[str(BACKEND / 'app')] if CFG.reload else None,
         env_file=str(BACKEND / '.env'),
+        loop='uvloop' if os.name != 'nt' else 'asyncio',
+        http='httptools',
     )
 
 if __name__ == '__main__':
@@ -1,36 +1,48 @@
 """Unified backend launcher.
 
-Ensures project root and backend added to sys.path, applies monkeypatches
+Applies monkeypatches
 early, then runs uvicorn. Use instead of ad-hoc task commands.
 """
 from __future__ import annotations
-import os, sys, pathlib, uvicorn
+import os, pathlib, types, uvicorn
 
 ROOT = pathlib.Path(__file__).resolve().parents[1]
 BACKEND = ROOT / 'backend'
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
-if str(BACKEND) not in sys.path:
-    sys.path.insert(0, str(BACKEND))
 
-# Apply patches
+# Apply patches (the app package is importable via the editable install;
+# no sys.path gymnastics needed)
 from app.core import monkeypatches  # noqa: F401
 
+# Environment resolved once at import; one audit point for everything this
+# launcher reads from the process environment.
+CFG = types.SimpleNamespace(
+    host=os.environ.get('BACKEND_HOST', '0.0.0.0'),
+    port=int(os.environ.get('BACKEND_PORT', '8000')),
+    env=os.environ.get('ENVIRONMENT', 'development'),
+    force_reload=os.environ.get('FORCE_RELOAD', '').lower() == 'true',
+)
+
 def main():
-    os.chdir(BACKEND)
     # On Windows, uvicorn reload can cause import issues with native extensions.
     # Default to no-reload on Windows unless FORCE_RELOAD=true is set.
-    env = os.environ.get('ENVIRONMENT', 'development')
-    force_reload = os.environ.get('FORCE_RELOAD', '').lower() == 'true'
     is_windows = os.name == 'nt'
-    reload_enabled = (env == 'development' and not is_windows) or force_reload
+    reload_enabled = (CFG.env == 'development' and not is_windows) or CFG.force_reload
 
     uvicorn.run(
         'main:app',
-        host=os.environ.get('BACKEND_HOST', '0.0.0.0'),
-        port=int(os.environ.get('BACKEND_PORT', '8000')),
+        host=CFG.host,
+        port=CFG.port,
         reload=reload_enabled,
+        # app_dir scopes the import path without os.chdir's process-global
+        # CWD change; reload_dirs narrows the reloader's watch set to the
+        # actual source tree instead of everything under the CWD
+        app_dir=str(BACKEND),
+        reload_dirs=[str(BACKEND / 'app')] if reload_enabled else None,
         env_file=str(BACKEND / '.env'),
+        # libuv event loop + C HTTP parser (both ship with uvicorn[standard]);
+        # uvloop has no Windows build
+        loop='uvloop' if not is_windows else 'asyncio',
+        http='httptools',
     )
 
 if __name__ == '__main__':
@@ -5,9 +5,18 @@ Validates environment and starts the server with production settings
 """
 import os
 import sys
+import types
 import logging
 from app.core.config import settings
 
+# Launcher configuration resolved from the environment once at import
+CFG = types.SimpleNamespace(
+    port=int(os.getenv("PORT", "8000")),
+    use_gunicorn=os.getenv("USE_GUNICORN", "").lower() in ("true", "1", "yes"),
+    workers=int(os.getenv("WEB_CONCURRENCY", str(2 * (os.cpu_count() or 1) + 1))),
+    preload=os.getenv("PRELOAD_APP", "").lower() in ("true", "1", "yes"),
+)
+
 def validate_production_environment():
     """Validate that all required environment variables are set for production"""
     required_vars = [
@@ -42,6 +51,18 @@ def validate_production_environment():
 
 def main():
     """Main production startup function"""
+    # Re-exec under -O so assert statements on the framework hot paths are
+    # stripped; sys.flags.optimize guards the child from looping. Bytecode
+    # is precompiled at image build, so workers also skip .pyc writes.
+    if not sys.flags.optimize and os.environ.get("PYTHONOPTIMIZE") != "1":
+        os.environ.setdefault("PYTHONDONTWRITEBYTECODE", "1")
+        # Export rather than rely on the -O flag alone: the gunicorn path
+        # below execs a fresh interpreter, and its master plus every forked
+        # worker must inherit optimization too (it also stops this guard
+        # from re-execing again)
+        os.environ["PYTHONOPTIMIZE"] = "1"
+        os.execvp(sys.executable, [sys.executable, "-O", os.path.abspath(__file__), *sys.argv[1:]])
+
     print("🚀 Starting CortejTech Backend in Production Mode...")
     print("=" * 60)
     
@@ -56,11 +77,37 @@ def main():
     print("🔒 Security settings applied")
     print("=" * 60)
     
-    # Get port from environment (Render sets this automatically)
-    port = int(os.getenv("PORT", "8000"))
+    # Port comes from the environment (Render sets this automatically)
+    port = CFG.port
     print(f"🌐 Starting server on port {port}")
-    
-    # Import and start server
+
+    # Preferred production path: Gunicorn's pre-fork master with uvicorn
+    # workers gives graceful rolling restarts and worker recycling
+    # (max-requests bounds per-worker RSS growth), which uvicorn's own
+    # workers= multiprocessing does not. Worker count is set here only —
+    # never also via uvicorn — to avoid a fork-of-forks explosion.
+    if CFG.use_gunicorn:
+        argv = [
+            "gunicorn", "main:app",
+            "-k", "uvicorn.workers.UvicornWorker",
+            "-w", str(CFG.workers),
+            "-b", f"0.0.0.0:{port}",
+            "--max-requests", "10000",
+            "--max-requests-jitter", "1000",
+            "--graceful-timeout", "30",
+            "--timeout", "60",
+            "--access-logfile", "-",
+        ]
+        # Import main:app once in the master and share its read-only pages
+        # with workers via copy-on-write. Safe here because connection-holding
+        # resources (DB client, JWKS task, httpx pools) are created in the
+        # lifespan handler, which runs post-fork; gated anyway in case
+        # fork-unsafe import-time state is ever introduced.
+        if CFG.preload:
+            argv.append("--preload")
+        os.execvp("gunicorn", argv)
+
+    # Fallback/debug path: plain uvicorn with its built-in worker manager
     try:
         import uvicorn
         uvicorn.run(
@@ -69,7 +116,9 @@ def main():
             port=port,
             workers=4,
             access_log=True,
-            log_level="info"
+            log_level="info",
+            loop="uvloop" if os.name != "nt" else "asyncio",
+            http="httptools",
         )
     except KeyboardInterrupt:
         print("\n👋 Server stopped by user")